@@ -23,8 +23,105 @@ It generates the same ScalarAnimation/VectorAnimation objects
 under the hood, but with cleaner syntax.
 """
 
+from functools import lru_cache
+
 import c4d
-from DreamTalk.animation.animation import ScalarAnimation, VectorAnimation, AnimationGroup
+
+
+def _component_desc_id(base, component):
+    """Build the DescID addressing one component of a vector parameter."""
+    return c4d.DescID(
+        c4d.DescLevel(base, c4d.DTYPE_VECTOR, 0),
+        c4d.DescLevel(component, c4d.DTYPE_REAL, 0)
+    )
+
+
+# Built-in transform components: parameter name -> (vector parameter, component)
+_POSITION_MAP = {
+    'x': (c4d.ID_BASEOBJECT_POSITION, c4d.VECTOR_X),
+    'y': (c4d.ID_BASEOBJECT_POSITION, c4d.VECTOR_Y),
+    'z': (c4d.ID_BASEOBJECT_POSITION, c4d.VECTOR_Z),
+}
+_ROTATION_MAP = {
+    'h': (c4d.ID_BASEOBJECT_ROTATION, c4d.VECTOR_X),
+    'p': (c4d.ID_BASEOBJECT_ROTATION, c4d.VECTOR_Y),
+    'b': (c4d.ID_BASEOBJECT_ROTATION, c4d.VECTOR_Z),
+}
+_SCALE_MAP = {
+    'scale_x': (c4d.ID_BASEOBJECT_SCALE, c4d.VECTOR_X),
+    'scale_y': (c4d.ID_BASEOBJECT_SCALE, c4d.VECTOR_Y),
+    'scale_z': (c4d.ID_BASEOBJECT_SCALE, c4d.VECTOR_Z),
+}
+
+# Ready-made DescIDs of all built-in transform components, built once at import.
+# Uniform 'scale' uses scale_x as proxy until multi-track animation exists.
+_BUILTIN_COMPONENTS = {
+    name: _component_desc_id(base, component)
+    for name, (base, component) in {
+        **_POSITION_MAP,
+        **_ROTATION_MAP,
+        **_SCALE_MAP,
+        'scale': (c4d.ID_BASEOBJECT_SCALE, c4d.VECTOR_X),
+    }.items()
+}
+
+# Vector parameters animated as a whole by VectorAnimatorProxy
+_VECTOR_DESCRIPTORS = {
+    'position': c4d.ID_BASEOBJECT_POSITION,
+    'rotation': c4d.ID_BASEOBJECT_ROTATION,
+    'scale': c4d.ID_BASEOBJECT_SCALE,
+}
+
+
+# =============================================================================
+# DESCID RESOLVERS - tried in priority order by ParameterAnimator
+# =============================================================================
+
+def _resolve_param_attr(target, name):
+    """UserData parameter with matching name (e.g., self.fold_parameter)."""
+    # Holons precompute their parameter table at construction; attributes
+    # set after that are still found below
+    param_table = getattr(target, '_param_descid_table', None)
+    if param_table is not None:
+        desc_id = param_table.get(name)
+        if desc_id is not None:
+            return desc_id
+    param = getattr(target, name + '_parameter', None)
+    return getattr(param, 'desc_id', None)
+
+
+def _resolve_id_attr(target, name):
+    """Direct desc_id attribute (e.g., self.draw_id)."""
+    return getattr(target, name + '_id', None)
+
+
+def _resolve_builtin(target, name):
+    """Built-in position/rotation/scale components (x, y, z, h, p, b)."""
+    return _BUILTIN_COMPONENTS.get(name)
+
+
+def _resolve_userdata(target, name):
+    """UserData by name, indexing the container once per target."""
+    obj = getattr(target, 'obj', None)
+    if obj is None:
+        return None
+    index = getattr(target, '_ud_name_to_descid', None)
+    if index is None:
+        index = {}
+        for desc_id, bc in obj.GetUserDataContainer():
+            index.setdefault(bc[c4d.DESC_NAME], desc_id)
+        target._ud_name_to_descid = index
+    return index.get(name)
+
+
+_RESOLVERS = [_resolve_param_attr, _resolve_id_attr, _resolve_builtin, _resolve_userdata]
+
+
+@lru_cache(maxsize=1)
+def _empty_animation_group():
+    """Shared empty AnimationGroup - empty groups are interchangeable."""
+    from DreamTalk.animation.animation import AnimationGroup
+    return AnimationGroup()
 
 
 class AnimatorProxy:
@@ -37,11 +134,17 @@ class AnimatorProxy:
     Usage:
         virus.animate.fold(0.5)  # Returns animation for fold parameter
         virus.animate.x(100)     # Returns animation for x position
+
+    The proxy cached on each holon is a root proxy: it never collects
+    animations itself, each call on it starts a fresh chain proxy.
     """
 
-    def __init__(self, target):
+    __slots__ = ('target', '_animations', '_param_cache')
+
+    def __init__(self, target, root=False):
         self.target = target
-        self._animations = []
+        self._animations = None if root else []
+        self._param_cache = {}
 
     def __getattr__(self, name):
         """Return a ParameterAnimator for the named parameter."""
@@ -51,11 +154,21 @@ class AnimatorProxy:
         # Don't intercept attributes that Scene.get_animation checks for
         if name in ('scalar_animations', 'execute'):
             raise AttributeError(name)
-        return ParameterAnimator(self.target, name, self)
+        # Parameter animators are stateless, so reuse one per name
+        animator = self._param_cache.get(name)
+        if animator is None:
+            animator = ParameterAnimator(self.target, name, self)
+            self._param_cache[name] = animator
+        return animator
 
     def _add_animation(self, animation):
-        """Add an animation to the chain."""
+        """Add an animation to the chain and return the proxy holding it."""
+        if self._animations is None:
+            chain = AnimatorProxy(self.target)
+            chain._animations.append(animation)
+            return chain
         self._animations.append(animation)
+        return self
 
     @property
     def animations(self):
@@ -65,11 +178,12 @@ class AnimatorProxy:
         This property is used by Scene.get_animation() to extract
         the animations for playback.
         """
-        if len(self._animations) == 0:
-            return AnimationGroup()
+        from DreamTalk.animation.animation import AnimationGroup
+        if not self._animations:
+            return _empty_animation_group()
         if len(self._animations) == 1:
             return self._animations[0]
-        return AnimationGroup(*self._animations)
+        return AnimationGroup.from_list(self._animations)
 
 
 class ParameterAnimator:
@@ -84,6 +198,8 @@ class ParameterAnimator:
         virus.animate.fold.sequence(1, 0) # Animate fold through 1, then 0
     """
 
+    __slots__ = ('target', 'param_name', 'proxy')
+
     def __init__(self, target, param_name, proxy=None):
         self.target = target
         self.param_name = param_name
@@ -100,6 +216,7 @@ class ParameterAnimator:
         Returns:
             AnimatorProxy for chaining, or ScalarAnimation if not chaining
         """
+        from DreamTalk.animation.animation import ScalarAnimation
         desc_id = self._get_desc_id()
         if desc_id is None:
             raise ValueError(f"Parameter '{self.param_name}' not found on {self.target}")
@@ -111,12 +228,13 @@ class ParameterAnimator:
             relative=relative
         )
 
-        # Update the actual value on the object
+        # Update the actual value on the object. Not redundant: animations
+        # read their start value from the object when constructed, so the
+        # next animation of this parameter must see the value set here.
         self.target.obj[desc_id] = value
 
         if self.proxy:
-            self.proxy._add_animation(animation)
-            return self.proxy
+            return self.proxy._add_animation(animation)
         return animation
 
     def sequence(self, *values):
@@ -134,110 +252,67 @@ class ParameterAnimator:
         Example:
             virus.animate.fold.sequence(1, 0.1, 1)  # Open, close, open
         """
+        from DreamTalk.animation.animation import ScalarAnimation, AnimationGroup
         desc_id = self._get_desc_id()
         if desc_id is None:
             raise ValueError(f"Parameter '{self.param_name}' not found on {self.target}")
 
-        animations = []
+        # Relative time grid, shared by neighbouring animations
         n = len(values)
+        step = 1.0 / n if n else 0.0
+        times = [i * step for i in range(n)] + [1.0]
 
-        for i, value in enumerate(values):
-            anim = ScalarAnimation(
+        animations = [
+            ScalarAnimation(
                 target=self.target,
                 descriptor=desc_id,
                 value_fin=value,
-                rel_start=i / n,
-                rel_stop=(i + 1) / n
+                rel_start=rel_start,
+                rel_stop=rel_stop
             )
-            animations.append(anim)
+            for value, rel_start, rel_stop in zip(values, times, times[1:])
+        ]
 
-        # Set final value on object
+        # Set final value on object (start value for the next animation)
         if values:
             self.target.obj[desc_id] = values[-1]
 
-        animation_group = AnimationGroup(*animations)
+        animation_group = AnimationGroup.from_list(animations)
 
         if self.proxy:
-            self.proxy._add_animation(animation_group)
-            return self.proxy
+            return self.proxy._add_animation(animation_group)
         return animation_group
 
     def _get_desc_id(self):
         """
         Get the C4D DescID for this parameter.
 
-        Checks in order:
-        1. UserData parameter with matching name (e.g., fold_parameter)
-        2. Built-in position/rotation/scale components (x, y, z, h, p, b)
-        3. UserData by searching the container
+        Results are cached on the target, so repeated animations of the same
+        parameter skip the resolution chain. A holon's UserData is fixed once
+        it is constructed, and the cache is dropped together with the holon.
+        Unresolved names are not cached.
         """
-        # Check for parameter object attribute (e.g., self.fold_parameter)
-        param_attr = self.param_name + '_parameter'
-        if hasattr(self.target, param_attr):
-            param = getattr(self.target, param_attr)
-            if hasattr(param, 'desc_id'):
-                return param.desc_id
-
-        # Check for direct desc_id attribute (e.g., self.fold_id)
-        id_attr = self.param_name + '_id'
-        if hasattr(self.target, id_attr):
-            return getattr(self.target, id_attr)
-
-        # Handle built-in position components
-        position_map = {
-            'x': (c4d.ID_BASEOBJECT_POSITION, c4d.VECTOR_X),
-            'y': (c4d.ID_BASEOBJECT_POSITION, c4d.VECTOR_Y),
-            'z': (c4d.ID_BASEOBJECT_POSITION, c4d.VECTOR_Z),
-        }
-        if self.param_name in position_map:
-            base, component = position_map[self.param_name]
-            return c4d.DescID(
-                c4d.DescLevel(base, c4d.DTYPE_VECTOR, 0),
-                c4d.DescLevel(component, c4d.DTYPE_REAL, 0)
-            )
-
-        # Handle built-in rotation components
-        rotation_map = {
-            'h': (c4d.ID_BASEOBJECT_ROTATION, c4d.VECTOR_X),
-            'p': (c4d.ID_BASEOBJECT_ROTATION, c4d.VECTOR_Y),
-            'b': (c4d.ID_BASEOBJECT_ROTATION, c4d.VECTOR_Z),
-        }
-        if self.param_name in rotation_map:
-            base, component = rotation_map[self.param_name]
-            return c4d.DescID(
-                c4d.DescLevel(base, c4d.DTYPE_VECTOR, 0),
-                c4d.DescLevel(component, c4d.DTYPE_REAL, 0)
-            )
-
-        # Handle built-in scale components
-        scale_map = {
-            'scale_x': (c4d.ID_BASEOBJECT_SCALE, c4d.VECTOR_X),
-            'scale_y': (c4d.ID_BASEOBJECT_SCALE, c4d.VECTOR_Y),
-            'scale_z': (c4d.ID_BASEOBJECT_SCALE, c4d.VECTOR_Z),
-        }
-        if self.param_name in scale_map:
-            base, component = scale_map[self.param_name]
-            return c4d.DescID(
-                c4d.DescLevel(base, c4d.DTYPE_VECTOR, 0),
-                c4d.DescLevel(component, c4d.DTYPE_REAL, 0)
-            )
+        cache = getattr(self.target, '_desc_id_cache', None)
+        if cache is None:
+            cache = self.target._desc_id_cache = {}
 
-        # Handle uniform scale
-        if self.param_name == 'scale':
-            # For uniform scale, we'd need to return multiple animations
-            # For now, just use scale_x as proxy
-            return c4d.DescID(
-                c4d.DescLevel(c4d.ID_BASEOBJECT_SCALE, c4d.DTYPE_VECTOR, 0),
-                c4d.DescLevel(c4d.VECTOR_X, c4d.DTYPE_REAL, 0)
-            )
+        desc_id = cache.get(self.param_name)
+        if desc_id is None:
+            desc_id = self._resolve_desc_id()
+            if desc_id is not None:
+                cache[self.param_name] = desc_id
+        return desc_id
 
-        # Search UserData by name
-        if hasattr(self.target, 'obj'):
-            ud = self.target.obj.GetUserDataContainer()
-            for desc_id, bc in ud:
-                if bc[c4d.DESC_NAME] == self.param_name:
-                    return desc_id
+    def _resolve_desc_id(self):
+        """
+        Resolve the C4D DescID for this parameter.
 
+        Tries each resolver in _RESOLVERS in order, returning the first hit.
+        """
+        for resolve in _RESOLVERS:
+            desc_id = resolve(self.target, self.param_name)
+            if desc_id is not None:
+                return desc_id
         return None
 
 
@@ -250,36 +325,34 @@ class VectorAnimatorProxy:
         virus.animate.rotation(h=PI/4)
     """
 
+    __slots__ = ('target', 'vector_type')
+
     def __init__(self, target, vector_type):
         self.target = target
         self.vector_type = vector_type  # 'position', 'rotation', 'scale'
 
     def __call__(self, x=None, y=None, z=None, vector=None, relative=False):
         """Animate the vector to target values."""
+        from DreamTalk.animation.animation import VectorAnimation
         if vector is not None:
             if isinstance(vector, c4d.Vector):
                 x, y, z = vector.x, vector.y, vector.z
             else:
                 x, y, z = vector
 
-        descriptors = {
-            'position': c4d.ID_BASEOBJECT_POSITION,
-            'rotation': c4d.ID_BASEOBJECT_ROTATION,
-            'scale': c4d.ID_BASEOBJECT_SCALE,
-        }
-
-        descriptor = descriptors.get(self.vector_type)
+        descriptor = _VECTOR_DESCRIPTORS.get(self.vector_type)
         if descriptor is None:
             raise ValueError(f"Unknown vector type: {self.vector_type}")
 
         # Get current values for any unspecified components
-        current = self.target.obj[descriptor]
-        if x is None:
-            x = current.x
-        if y is None:
-            y = current.y
-        if z is None:
-            z = current.z
+        if x is None or y is None or z is None:
+            current = self.target.obj[descriptor]
+            if x is None:
+                x = current.x
+            if y is None:
+                y = current.y
+            if z is None:
+                z = current.z
 
         target_vector = c4d.Vector(x, y, z)
 
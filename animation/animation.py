@@ -7,12 +7,13 @@ class KeyFrame:
     """a keyframe object is responsible for creating a keyframe in c4d for a single target for a single description id
     with a specific value and time"""
 
-    def __init__(self, target, desc_id, value=None, time=None):
+    def __init__(self, target, desc_id, value=None, time=None, track=None):
         self.document = c4d.documents.GetActiveDocument()  # get document
         self.target = target
         self.desc_id = desc_id
         self.value = value
         self.time = time
+        self.track = track  # known track of the desc id, skips the lookup
         self.get_time()
         self.get_track()
         self.get_curve()
@@ -21,6 +22,8 @@ class KeyFrame:
 
     def get_track(self):
         """finds or create the animation track for the given target"""
+        if self.track is not None:
+            return
         self.track = self.target.obj.FindCTrack(self.desc_id)
         if self.track is None:
             self.track = c4d.CTrack(self.target.obj, self.desc_id)
@@ -163,7 +166,8 @@ class ScalarAnimation(ProtoAnimation):
         self.key_ini = KeyFrame(
             self.target, self.desc_id, value=self.value_ini, time=self.global_time(self.abs_start))  # create initial keyframe
         self.key_fin = KeyFrame(
-            self.target, self.desc_id, value=self.value_fin, time=self.global_time(self.abs_stop))  # create final keyframe
+            self.target, self.desc_id, value=self.value_fin, time=self.global_time(self.abs_stop),
+            track=self.key_ini.track)  # create final keyframe on the same track
 
     def scale_relative_run_time(self, abs_run_time):
         """scales the relative run time by the absolute run time"""
@@ -342,6 +346,14 @@ class AnimationGroup:
         self.animations = self.digest_input(animations)
         self.category = category
 
+    @classmethod
+    def from_list(cls, animations, category=None):
+        """creates an animation group directly from a list of animations, avoiding the argument tuple of *animations"""
+        animation_group = cls.__new__(cls)
+        animation_group.animations = animation_group.digest_input(animations)
+        animation_group.category = category
+        return animation_group
+
     def __repr__(self):
         strings = "AnimationGroup: "
         for animation in self.animations:
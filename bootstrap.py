@@ -28,13 +28,44 @@ Or even simpler, just add submodules to path and import directly:
 
 The bootstrap.init() call is only needed for complex nested holarchies
 where you want to ensure all nested submodules use the same DreamTalk.
+
+The path resolved for a script's directory is remembered in the
+DREAMTALK_PATHS environment variable, so later runs of scripts in the same
+directory skip the directory walk for the rest of the Cinema 4D session.
 """
 
+import json
+import os
 import sys
 from pathlib import Path
 
 _initialized = False
 _dreamtalk_path = None
+_search_cache = {}  # start path -> resolved submodules/ directory
+
+# Environment variable holding {resolved start directory: DreamTalk directory}
+# as JSON. Unlike module globals it survives purging DreamTalk from sys.modules
+_PATHS_ENV = "DREAMTALK_PATHS"
+
+
+def _caller_dir():
+    """Directory of the nearest calling file outside DreamTalk, or the cwd."""
+    caller_frame = sys._getframe(1)
+    while caller_frame:
+        caller_file = caller_frame.f_globals.get('__file__')
+        if caller_file and 'DreamTalk' not in str(caller_file):
+            return Path(caller_file).parent
+        caller_frame = caller_frame.f_back
+    return Path.cwd()
+
+
+def _remembered_paths():
+    """Paths remembered by init() in this process, keyed by start directory."""
+    try:
+        paths = json.loads(os.environ.get(_PATHS_ENV, "{}"))
+    except ValueError:
+        return {}
+    return paths if isinstance(paths, dict) else {}
 
 
 def find_dreamtalk(start_path=None):
@@ -55,18 +86,11 @@ def find_dreamtalk(start_path=None):
     """
     if start_path is None:
         # Get the caller's file location by walking up the stack
-        import inspect
-        frame = inspect.currentframe()
-        if frame:
-            caller_frame = frame.f_back
-            while caller_frame:
-                caller_file = caller_frame.f_globals.get('__file__')
-                if caller_file and 'DreamTalk' not in str(caller_file):
-                    start_path = Path(caller_file).parent
-                    break
-                caller_frame = caller_frame.f_back
-        if start_path is None:
-            start_path = Path.cwd()
+        start_path = _caller_dir()
+
+    cache_key = str(start_path)
+    if cache_key in _search_cache:
+        return _search_cache[cache_key]
 
     current = Path(start_path).resolve()
 
@@ -74,10 +98,12 @@ def find_dreamtalk(start_path=None):
         # Check for DreamTalk in submodules/
         candidate = current / "submodules" / "DreamTalk"
         if (candidate / "imports.py").exists():
+            _search_cache[cache_key] = current / "submodules"
             return current / "submodules"
 
         # Also check if we ARE in DreamTalk (for development/testing)
-        if (current / "imports.py").exists() and current.name == "DreamTalk":
+        if current.name == "DreamTalk" and (current / "imports.py").exists():
+            _search_cache[cache_key] = current.parent
             return current.parent
 
         current = current.parent
@@ -108,7 +134,19 @@ def init(start_path=None):
     if _initialized:
         return _dreamtalk_path
 
-    submodules_path = find_dreamtalk(start_path)
+    if start_path is None:
+        # Reuse the path resolved by an earlier run from the same directory
+        start_dir = str(_caller_dir().resolve())
+        paths = _remembered_paths()
+        cached_path = paths.get(start_dir)
+        if cached_path and (Path(cached_path) / "imports.py").exists():
+            submodules_path = Path(cached_path).parent
+        else:
+            submodules_path = find_dreamtalk(start_dir)
+            paths[start_dir] = str(submodules_path / "DreamTalk")
+            os.environ[_PATHS_ENV] = json.dumps(paths)
+    else:
+        submodules_path = find_dreamtalk(start_path)
 
     # Add to sys.path if not already present
     submodules_str = str(submodules_path)
@@ -18,11 +18,15 @@ Usage:
     # 3. Recursively converts child CustomObjects that also have GeneratorMixin
 """
 
+import ast
 import c4d
+import io
 import math
+import sys
+from functools import lru_cache
 
-# Standard imports that generator code will need
-GENERATOR_IMPORTS = '''import c4d
+# Standard imports that generator code will need (interned: shared by every generator)
+GENERATOR_IMPORTS = sys.intern('''import c4d
 import math
 PI = math.pi
 
@@ -33,10 +37,10 @@ def get_userdata_by_name(obj, param_name):
         if bc[c4d.DESC_NAME] == param_name:
             try:
                 return obj[desc_id]
-            except:
+            except (AttributeError, TypeError):
                 return None
     return None
-'''
+''')
 
 
 class GeneratorMixin:
@@ -65,126 +69,49 @@ class GeneratorMixin:
         Returns:
             str: Python code for main() function, or empty string if no relations
         """
-        if not hasattr(self, 'relations') or not self.relations:
+        relations = getattr(self, 'relations', None)
+        if not relations:
             # No relations defined, return minimal pass-through code
             return '''
 def main():
     return None
 '''
 
-        code_lines = []
-        code_lines.append('def main():')
-
-        # Track which parameters we need to read
-        params_to_read = set()
+        # Track which parameters we need to read (variable name -> display name)
+        params_to_read = {}
         child_updates = []
 
-        for relation in self.relations:
-            rel_class = relation.__class__.__name__
-
-            if rel_class == 'XIdentity':
-                # XIdentity: pass parameter value directly to child
-                # relation.parameter = source param on whole (self)
-                # relation.part = target child object
-                # relation.desc_ids = target parameter(s) on child
-
-                param = relation.parameter
-                part = relation.part
-                target_desc_ids = relation.desc_ids
-
-                # Build parameter read
-                param_name = param.name.lower().replace(' ', '_')
-                params_to_read.add((param_name, param))
-
-                # Build child update
-                child_name = part.obj.GetName() if hasattr(part, 'obj') else str(part)
-                for desc_id in target_desc_ids:
-                    child_updates.append((child_name, desc_id, param_name, None))
-
-            elif rel_class == 'XRelation':
-                # XRelation: apply formula to parameter before passing to child
-                param = relation.parameters[0] if relation.parameters else None
-                if param:
-                    param_name = param.name.lower().replace(' ', '_')
-                    params_to_read.add((param_name, param))
-
-                    part = relation.part
-                    child_name = part.obj.GetName() if hasattr(part, 'obj') else str(part)
-                    formula = relation.formula if hasattr(relation, 'formula') else None
-
-                    for desc_id in relation.desc_ids:
-                        child_updates.append((child_name, desc_id, param_name, formula))
-
-        # Generate parameter reading code
-        for param_name, param in params_to_read:
-            # Use name-based lookup for robustness
-            code_lines.append(f'    # Read {param.name} parameter')
-            code_lines.append(f'    {param_name} = get_userdata_by_name(op, "{param.name}")')
-            code_lines.append(f'    if {param_name} is None:')
-            code_lines.append(f'        {param_name} = 0.0  # fallback')
-            code_lines.append('')
-
-        # Generate child traversal and update code
-        if child_updates:
-            code_lines.append('    # Update children')
-            code_lines.append('    child = op.GetDown()')
-            code_lines.append('    while child:')
-
-            # Group updates by child name
-            updates_by_child = {}
-            for child_name, desc_id, param_name, formula in child_updates:
-                if child_name not in updates_by_child:
-                    updates_by_child[child_name] = []
-                updates_by_child[child_name].append((desc_id, param_name, formula))
-
-            for child_name, updates in updates_by_child.items():
-                code_lines.append(f'        if child.GetName() == "{child_name}":')
-                for desc_id, param_name, formula in updates:
-                    # Determine what value to set
-                    if formula:
-                        # Apply formula - replace parameter name with variable
-                        value_expr = formula.replace(param_name.replace('_', ' ').title(), param_name)
-                        value_expr = value_expr.replace('PI', 'PI')
-                    else:
-                        value_expr = param_name
-
-                    # Determine target - is it a UserData param or a built-in?
-                    if hasattr(desc_id, '__iter__') and len(desc_id) == 2:
-                        # Likely a rotation or position component
-                        # Check if it's ROT_P, ROT_B, etc.
-                        code_lines.append(f'            # Set parameter via UserData')
-                        code_lines.append(f'            child[c4d.DescID(c4d.DescLevel(c4d.ID_USERDATA, c4d.DTYPE_SUBCONTAINER, 0),')
-                        code_lines.append(f'                            c4d.DescLevel(1, c4d.DTYPE_REAL, 0))] = {value_expr}')
-                    else:
-                        code_lines.append(f'            child[c4d.DescID(c4d.DescLevel(c4d.ID_USERDATA, c4d.DTYPE_SUBCONTAINER, 0),')
-                        code_lines.append(f'                            c4d.DescLevel(1, c4d.DTYPE_REAL, 0))] = {value_expr}')
-
-            code_lines.append('        child = child.GetNext()')
-
-        code_lines.append('')
-        code_lines.append('    return None')
-
-        return '\n'.join(code_lines)
+        for relation in relations:
+            # Keyed by class name, which stays stable across module reloads
+            collect = _RELATION_COLLECTORS.get(type(relation).__name__)
+            if collect is not None:
+                collect(relation, params_to_read, child_updates)
+
+        # The emitted code is a pure function of names, formulas and target
+        # DescIDs, so render it from a hashable signature and reuse the result
+        params_sig = tuple(params_to_read.items())
+        updates_sig = tuple(
+            (child_name, _desc_id_expr(desc_id), param_name, formula)
+            for child_name, desc_id, param_name, formula in child_updates)
+        return _render_relations_code(params_sig, updates_sig)
 
     def _build_generator_code(self):
         """Build complete generator code including imports."""
         # PREFER manual specify_generator_code if defined (more reliable)
-        if hasattr(self, 'specify_generator_code'):
-            user_code = self.specify_generator_code()
+        specify_generator_code = getattr(self, 'specify_generator_code', None)
+        if specify_generator_code is not None:
+            user_code = specify_generator_code()
             if user_code and user_code.strip():
-                return GENERATOR_IMPORTS + '\n' + user_code
+                return _with_generator_imports(user_code)
 
         # Fall back to auto-generation from relations
         auto_code = self._auto_generate_code_from_relations()
-        if auto_code and 'child = op.GetDown()' in auto_code:
+        if auto_code and '_HANDLERS' in auto_code:
             # Only use auto-generated code if it actually does something
-            return GENERATOR_IMPORTS + '\n' + auto_code
+            return _with_generator_imports(auto_code)
 
         # Default: minimal pass-through
-        return GENERATOR_IMPORTS + '''
-def main():
-    return None
-'''
+        return _PASSTHROUGH_GENERATOR_CODE
 
     def create_as_generator(self, recursive=True):
         """
@@ -198,7 +125,8 @@ def main():
         """
         # Create the generator object
         gen = c4d.BaseObject(1023866)  # Python Generator
-        gen.SetName(self.obj.GetName() if hasattr(self, 'obj') else self.__class__.__name__)
+        obj = getattr(self, 'obj', None)
+        gen.SetName(obj.GetName() if obj is not None else self.__class__.__name__)
 
         # Set the code
         gen[c4d.OPYTHON_CODE] = self._build_generator_code()
@@ -212,24 +140,36 @@ def main():
 
         return gen
 
-    def _copy_userdata_to_generator(self, gen):
-        """Copy UserData definitions from self.obj to the generator."""
-        if not hasattr(self, 'obj'):
+    def _copy_userdata_to_generator(self, gen, strict=True):
+        """Copy UserData definitions from self.obj to the generator.
+
+        Args:
+            gen: The generator object to add the UserData to
+            strict: If False, skip values that fail to copy for any reason,
+                not just the data types Python cannot access
+        """
+        source = getattr(self, 'obj', None)
+        if source is None:
             return
 
-        # Get UserData container from source
-        ud = self.obj.GetUserDataContainer()
-        for desc_id, bc in ud:
-            # Skip group headers
-            if bc[c4d.DESC_CUSTOMGUI] == c4d.CUSTOMGUI_SEPARATOR:
-                continue
+        # Get UserData entries from source, skipping group headers
+        separator = c4d.CUSTOMGUI_SEPARATOR
+        entries = [(desc_id, bc) for desc_id, bc in source.GetUserDataContainer()
+                   if bc[c4d.DESC_CUSTOMGUI] != separator]
+        for desc_id, bc in entries:
             # Add to generator
             new_id = gen.AddUserData(bc)
-            # Copy the value
+            # Groups hold no value to copy
+            if desc_id[desc_id.GetDepth() - 1].dtype == c4d.DTYPE_GROUP:
+                continue
+            # Copy the value (some data types are not accessible from Python)
             try:
-                gen[new_id] = self.obj[desc_id]
-            except:
+                gen[new_id] = source[desc_id]
+            except (AttributeError, TypeError):
                 pass
+            except Exception:
+                if strict:
+                    raise
 
     def _move_children_to_generator(self, gen, recursive=True):
         """Move children from self.obj to the generator.
@@ -238,22 +178,16 @@ def main():
             gen: The generator object to move children under
             recursive: If True, convert child CustomObjects with GeneratorMixin to generators
         """
-        if not hasattr(self, 'obj'):
+        obj = getattr(self, 'obj', None)
+        if obj is None:
             return
 
-        # Collect children and their DreamTalk wrapper objects
-        children_to_move = []
-        child = self.obj.GetDown()
-        while child:
-            children_to_move.append(child)
-            child = child.GetNext()
+        # Collect children up front, moving them invalidates sibling links
+        children_to_move = obj.GetChildren()
 
         # Check if we have parts that map to these children
-        parts_by_name = {}
-        if hasattr(self, 'parts'):
-            for part in self.parts:
-                if hasattr(part, 'obj'):
-                    parts_by_name[part.obj.GetName()] = part
+        parts_by_name = {part.obj.GetName(): part for part in getattr(self, 'parts', ())
+                         if getattr(part, 'obj', None) is not None}
 
         # Move/convert each child
         for child_obj in children_to_move:
@@ -263,15 +197,235 @@ def main():
             child_name = child_obj.GetName()
             part = parts_by_name.get(child_name)
 
-            if recursive and part and hasattr(part, 'create_as_generator'):
+            create_as_generator = getattr(part, 'create_as_generator', None) if recursive else None
+            if create_as_generator is not None:
                 # This child is a CustomObject with GeneratorMixin - convert it
-                child_gen = part.create_as_generator(recursive=True)
+                child_gen = create_as_generator(recursive=True)
                 child_gen.InsertUnder(gen)
             else:
                 # Regular child - just move it
                 child_obj.InsertUnder(gen)
 
 
+@lru_cache(maxsize=None)
+def _param_slug(display_name):
+    """Variable name used in generator code for a parameter's display name."""
+    return display_name.lower().replace(' ', '_')
+
+
+def _collect_identity(relation, params_to_read, child_updates):
+    """
+    XIdentity: pass parameter value directly to child.
+
+    relation.parameters[0] is the source param on the whole, relation.part
+    the target child object and relation.desc_ids its target parameter(s).
+    """
+    param = relation.parameters[0] if relation.parameters else None
+    if param is None:
+        return
+    part = relation.part
+
+    # Build parameter read
+    param_name = _param_slug(param.name)
+    params_to_read.setdefault(param_name, param.name)
+
+    # Build child update
+    part_obj = getattr(part, 'obj', None)
+    child_name = part_obj.GetName() if part_obj is not None else str(part)
+    for desc_id in relation.desc_ids:
+        child_updates.append((child_name, desc_id, param_name, None))
+
+
+def _collect_relation(relation, params_to_read, child_updates):
+    """XRelation: apply formula to parameter before passing to child."""
+    param = relation.parameters[0] if relation.parameters else None
+    if param is None:
+        return
+    param_name = _param_slug(param.name)
+    params_to_read.setdefault(param_name, param.name)
+
+    part = relation.part
+    part_obj = getattr(part, 'obj', None)
+    child_name = part_obj.GetName() if part_obj is not None else str(part)
+    formula = getattr(relation, 'formula', None)
+
+    for desc_id in relation.desc_ids:
+        child_updates.append((child_name, desc_id, param_name, formula))
+
+
+# Relation class name -> collector of its parameter reads and child updates
+_RELATION_COLLECTORS = {
+    'XIdentity': _collect_identity,
+    'XRelation': _collect_relation,
+}
+
+
+def _desc_id_expr(desc_id):
+    """
+    Python source that rebuilds a relation's target DescID in generator code.
+
+    Args:
+        desc_id: c4d.DescID, plain parameter id, or (vector id, component) pair
+
+    Returns:
+        str: Expression constructing the equivalent c4d.DescID
+    """
+    if isinstance(desc_id, c4d.DescID):
+        levels = ', '.join(
+            f'c4d.DescLevel({level.id}, {level.dtype}, {level.creator})'
+            for level in (desc_id[i] for i in range(desc_id.GetDepth())))
+        return f'c4d.DescID({levels})'
+    if isinstance(desc_id, (tuple, list)) and len(desc_id) == 2:
+        base, component = desc_id
+        return (f'c4d.DescID(c4d.DescLevel({base}, c4d.DTYPE_VECTOR, 0), '
+                f'c4d.DescLevel({component}, c4d.DTYPE_REAL, 0))')
+    return f'c4d.DescID({int(desc_id)})'
+
+
+# Code templates for _render_relations_code - only the {slots} vary per relation
+_DESCIDS_OPEN = '# Target DescIDs, built once when the generator code loads\n'
+_DESCID_TMPL = '_DID_{index} = {desc_expr}\n'
+_HANDLER_OPEN_TMPL = 'def _update_{index}(child, {args}):\n'
+_UPDATE_TMPL = '    child[_DID_{desc_index}] = {value_expr}\n'
+_HANDLERS_OPEN = '# Update handler per child, looked up by name\n_HANDLERS = {\n'
+_HANDLER_ENTRY_TMPL = '    "{child_name}": _update_{index},\n'
+_HANDLERS_CLOSE = '}\n\n'
+_MAIN_OPEN = 'def main():\n'
+_PARAM_READ_TMPL = '''    # Read {display_name} parameter
+    {param_name} = get_userdata_by_name(op, "{display_name}")
+    if {param_name} is None:
+        {param_name} = 0.0  # fallback
+
+'''
+_CHILD_LOOP_TMPL = '''    # Update children
+    for child in op.GetChildren():
+        handler = _HANDLERS.get(child.GetName())
+        if handler is not None:
+            handler(child, {args})
+'''
+_MAIN_CLOSE = '\n    return None'
+
+
+class _RenameNames(ast.NodeTransformer):
+    """Rename variables in an expression by exact name."""
+
+    def __init__(self, renames):
+        self.renames = renames
+
+    def visit_Name(self, node):
+        new_id = self.renames.get(node.id)
+        if new_id is None:
+            return node
+        return ast.copy_location(ast.Name(id=new_id, ctx=node.ctx), node)
+
+
+def _formula_to_python(formula, renames):
+    """
+    Rewrite a relation formula to use generator variable names.
+
+    Args:
+        formula: Formula referring to parameters by display name
+        renames: Dict of display name -> variable name
+
+    Returns:
+        str: Python expression for the generator code
+    """
+    try:
+        tree = ast.parse(formula, mode='eval')
+    except SyntaxError:
+        # Not a Python expression (e.g. display names with spaces) - fall back
+        # to plain text replacement of the display names
+        for display_name, param_name in renames.items():
+            formula = formula.replace(display_name, param_name)
+        return formula
+    return ast.unparse(_RenameNames(renames).visit(tree))
+
+
+@lru_cache(maxsize=None)
+def _render_relations_code(params_sig, updates_sig):
+    """
+    Render generator code for relations extracted by GeneratorMixin.
+
+    Updates are grouped into one handler function per child, dispatched
+    through a name -> handler dict built once when the generator code loads,
+    so each tick costs one dict lookup per child.
+
+    Args:
+        params_sig: Tuple of (param_name, display_name) per parameter to read
+        updates_sig: Tuple of (child_name, desc_expr, param_name, formula)
+
+    Returns:
+        str: Python code for main() function
+    """
+    args = ', '.join(param_name for param_name, _ in params_sig)
+    # Formulas refer to parameters by display name
+    renames = {display_name: param_name for param_name, display_name in params_sig}
+
+    # Group updates by child name, sharing one DescID constant per target
+    desc_ids = {}
+    updates_by_child = {}
+    for child_name, desc_expr, param_name, formula in updates_sig:
+        if formula:
+            # Apply formula - replace parameter names with variables
+            value_expr = _formula_to_python(formula, renames)
+        else:
+            value_expr = param_name
+        desc_index = desc_ids.setdefault(desc_expr, len(desc_ids))
+        updates_by_child.setdefault(child_name, []).append(
+            _UPDATE_TMPL.format_map({'desc_index': desc_index, 'value_expr': value_expr}))
+
+    buf = io.StringIO()
+    write = buf.write
+
+    if updates_by_child:
+        write(_DESCIDS_OPEN)
+        for desc_expr, index in desc_ids.items():
+            write(_DESCID_TMPL.format_map({'index': index, 'desc_expr': desc_expr}))
+        write('\n\n')
+
+        for index, updates in enumerate(updates_by_child.values()):
+            write(_HANDLER_OPEN_TMPL.format_map({'index': index, 'args': args}))
+            for update in updates:
+                write(update)
+            write('\n\n')
+
+        write(_HANDLERS_OPEN)
+        for index, child_name in enumerate(updates_by_child):
+            write(_HANDLER_ENTRY_TMPL.format_map({'child_name': child_name, 'index': index}))
+        write(_HANDLERS_CLOSE)
+
+    write(_MAIN_OPEN)
+    # Generate parameter reading code (name-based lookup for robustness)
+    for param_name, display_name in params_sig:
+        write(_PARAM_READ_TMPL.format_map({'param_name': param_name, 'display_name': display_name}))
+    if updates_by_child:
+        write(_CHILD_LOOP_TMPL.format_map({'args': args}))
+    write(_MAIN_CLOSE)
+
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=None)
+def _with_generator_imports(code):
+    """
+    Prefix generator code with GENERATOR_IMPORTS.
+
+    The result is compiled once here so syntax errors in generated or
+    hand-written generator code surface while building the scene, not on
+    the generator's first evaluation inside Cinema 4D.
+    """
+    full_code = f'{GENERATOR_IMPORTS}\n{code}'
+    compile(full_code, '<dreamtalk generator>', 'exec')
+    return full_code
+
+
+# Complete code of a generator without relations
+_PASSTHROUGH_GENERATOR_CODE = GENERATOR_IMPORTS + '''
+def main():
+    return None
+'''
+
+
 def build_generator_from_class(cls, **kwargs):
     """
     Factory function to create a generator version of a CustomObject class.
@@ -290,8 +444,9 @@ def build_generator_from_class(cls, **kwargs):
     instance = cls(**kwargs)
 
     # Convert to generator
-    if hasattr(instance, 'create_as_generator'):
-        return instance.create_as_generator()
+    create_as_generator = getattr(instance, 'create_as_generator', None)
+    if create_as_generator is not None:
+        return create_as_generator()
     else:
         raise TypeError(f"{cls.__name__} must use GeneratorMixin")
 
@@ -299,6 +454,15 @@ def build_generator_from_class(cls, **kwargs):
 # === Relationship Helper Functions ===
 # These can be called from generator code to implement common patterns
 
+# Unit rotation vector per axis, signed by the fold direction
+_AXIS_VECS = {
+    'x': 'c4d.Vector({sign}1, 0, 0)',
+    'y': 'c4d.Vector(0, {sign}1, 0)',
+    'z': 'c4d.Vector(0, 0, {sign}1)',
+}
+_AXIS_ENTRY_TMPL = '    "{name}": {vec},\n'
+
+
 def relationship_code_fold_axes(fold_param_id, axes_config):
     """
     Generate code for folding axes based on a fold parameter.
@@ -311,34 +475,28 @@ def relationship_code_fold_axes(fold_param_id, axes_config):
     Returns:
         str: Python code for the main() function
     """
-    axis_code = []
-    for name, rot_axis, direction in axes_config:
-        sign = '+' if direction > 0 else '-'
-        if rot_axis == 'x':
-            axis_code.append(f'''
-        if child.GetName() == "{name}":
-            child.SetRelRot(c4d.Vector({sign}angle, 0, 0))''')
-        elif rot_axis == 'y':
-            axis_code.append(f'''
-        if child.GetName() == "{name}":
-            child.SetRelRot(c4d.Vector(0, {sign}angle, 0))''')
-        elif rot_axis == 'z':
-            axis_code.append(f'''
-        if child.GetName() == "{name}":
-            child.SetRelRot(c4d.Vector(0, 0, {sign}angle))''')
-
-    axes_str = '\n'.join(axis_code)
+    axes_entries = ''.join(
+        _AXIS_ENTRY_TMPL.format(name=name, vec=_AXIS_VECS[rot_axis].format(sign='' if direction > 0 else '-'))
+        for name, rot_axis, direction in axes_config
+        if rot_axis in _AXIS_VECS)
 
     return f'''
+_FOLD_ID = c4d.DescID({fold_param_id})
+
+# Rotation direction per axis child, looked up by name
+_AXES = {{
+{axes_entries}}}
+
 def main():
     # Read Fold parameter
-    fold = op[c4d.DescID({fold_param_id})]
+    fold = op[_FOLD_ID]
     angle = fold * PI / 2  # 0 to 90 degrees
 
     # Modify axis children
-    child = op.GetDown()
-    while child:{axes_str}
-        child = child.GetNext()
+    for child in op.GetChildren():
+        axis = _AXES.get(child.GetName())
+        if axis is not None:
+            child.SetRelRot(axis * angle)
 
     return None
 '''
@@ -355,16 +513,16 @@ def relationship_code_visibility(visibility_param_id):
         str: Python code for the main() function
     """
     return f'''
+_VISIBILITY_ID = c4d.DescID({visibility_param_id})
+
 def main():
-    visible = op[c4d.DescID({visibility_param_id})]
+    visible = op[_VISIBILITY_ID]
 
     # Set visibility on all children
-    child = op.GetDown()
-    while child:
+    for child in op.GetChildren():
         # 0 = visible, 1 = hidden in C4D
         child[c4d.ID_BASEOBJECT_VISIBILITY_EDITOR] = 0 if visible else 1
         child[c4d.ID_BASEOBJECT_VISIBILITY_RENDER] = 0 if visible else 1
-        child = child.GetNext()
 
     return None
 '''
@@ -385,15 +543,16 @@ def relationship_code_parameter_passthrough(source_param_id, child_name, target_
         str: Python code for the main() function
     """
     return f'''
+_SOURCE_ID = c4d.DescID({source_param_id})
+_TARGET_ID = c4d.DescID({target_param_id})
+
 def main():
-    value = op[c4d.DescID({source_param_id})]
+    value = op[_SOURCE_ID]
 
     # Pass to child
-    child = op.GetDown()
-    while child:
+    for child in op.GetChildren():
         if child.GetName() == "{child_name}":
-            child[c4d.DescID({target_param_id})] = value
-        child = child.GetNext()
+            child[_TARGET_ID] = value
 
     return None
 '''
@@ -22,12 +22,17 @@ except ImportError:
     from imp import reload
 
 def rreload(module):
-    """Recursively reload modules."""
-    reload(module)
-    for attribute_name in dir(module):
-        attribute = getattr(module, attribute_name)
-        if type(attribute) is ModuleType:
-            rreload(attribute)
+    """Recursively reload modules, reloading each reachable module once."""
+    seen = set()
+    stack = [module]
+    while stack:
+        module = stack.pop()
+        if id(module) in seen:
+            continue
+        seen.add(id(module))
+        reload(module)
+        stack.extend(attribute for attribute in reversed(list(vars(module).values()))
+                     if isinstance(attribute, ModuleType) and id(attribute) not in seen)
 
 
 # Reload submodules to pick up changes
@@ -56,23 +61,58 @@ import os as _os
 DreamTalk_path = _os.path.dirname(_os.path.abspath(__file__))
 
 # Reload order matters - dependencies first
-reload(DreamTalk.scene)
-reload(DreamTalk.utils)
-reload(DreamTalk.objects.abstract_objects)
-reload(DreamTalk.objects.helper_objects)
-reload(DreamTalk.objects.camera_objects)
-reload(DreamTalk.objects.custom_objects)
-reload(DreamTalk.objects.effect_objects)
-reload(DreamTalk.objects.stroke_objects)
-reload(DreamTalk.objects.line_objects)
-reload(DreamTalk.objects.solid_objects)
-reload(DreamTalk.constants)
-reload(DreamTalk.xpresso.userdata)
-reload(DreamTalk.xpresso.types)
-reload(DreamTalk.xpresso.states)
-reload(DreamTalk.animation.animation)
-reload(DreamTalk.animation.abstract_animators)
-reload(DreamTalk.animation.animate)
+_RELOAD_ORDER = (
+    DreamTalk.scene,
+    DreamTalk.utils,
+    DreamTalk.objects.abstract_objects,
+    DreamTalk.objects.helper_objects,
+    DreamTalk.objects.camera_objects,
+    DreamTalk.objects.custom_objects,
+    DreamTalk.objects.effect_objects,
+    DreamTalk.objects.stroke_objects,
+    DreamTalk.objects.line_objects,
+    DreamTalk.objects.solid_objects,
+    DreamTalk.constants,
+    DreamTalk.xpresso.userdata,
+    DreamTalk.xpresso.types,
+    DreamTalk.xpresso.states,
+    DreamTalk.animation.animation,
+    DreamTalk.animation.abstract_animators,
+    DreamTalk.animation.animate,
+)
+
+
+def _source_mtime(module):
+    """Modification time of a module's source file, or None if unknown."""
+    path = getattr(module, '__file__', None)
+    if not path:
+        return None
+    try:
+        return _os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _reload_if_changed(modules):
+    """
+    Reload modules only if one of their source files changed.
+
+    The last seen mtime is stamped on each module object, so it survives
+    reloads of this file. Modules import each other's names, so a single
+    changed file still reloads the whole chain in order.
+    """
+    for m in modules:
+        mtime = _source_mtime(m)
+        if mtime is None or getattr(m, '__dreamtalk_mtime__', None) != mtime:
+            break
+    else:
+        return
+    for m in modules:
+        reload(m)
+        m.__dreamtalk_mtime__ = _source_mtime(m)
+
+
+_reload_if_changed(_RELOAD_ORDER)
 
 
 # Import public API
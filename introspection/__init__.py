@@ -44,12 +44,19 @@ from .hierarchy import (
     get_scene_snapshot,
     diff_scene,
     reset_snapshot,
+    get_scene_version,
     # Console log tracking (for describe_scene delta)
     add_console_message,
     get_console_delta,
     reset_console_log,
 )
-from .formatters import format_for_ai, format_markdown, format_json, format_describe_scene
+from .formatters import (
+    format_for_ai,
+    format_markdown,
+    format_markdown_iter,
+    format_json,
+    format_describe_scene,
+)
 
 __all__ = [
     # Universal introspection (primary)
@@ -66,6 +73,7 @@ __all__ = [
     "get_scene_snapshot",
     "diff_scene",
     "reset_snapshot",
+    "get_scene_version",
     # Console log tracking
     "add_console_message",
     "get_console_delta",
@@ -73,6 +81,7 @@ __all__ = [
     # Formatters
     "format_for_ai",
     "format_markdown",
+    "format_markdown_iter",
     "format_json",
     "format_describe_scene",
 ]
@@ -4,20 +4,73 @@ Output Formatters for AI Consumption
 Transforms hierarchy descriptions into formats optimized for AI context windows.
 """
 
+import io
 import json
+import threading
+from collections import OrderedDict, defaultdict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def format_json(hierarchy_result):
+# Shared stand-in for missing sub-dicts; never mutated
+_EMPTY = {}
+
+# Fixed blocks around the format_markdown object tree
+_MD_HIER_OPEN = "## Hierarchy\n\n```\n"
+_MD_HIER_CLOSE = "```\n\n"
+
+# Stats section of format_markdown; type lines only appear for non-zero counts
+_STATS_HEAD_TMPL = "## Stats\n\n- Total objects: {total_objects}\n"
+_STATS_TYPE_TMPLS = (
+    ("custom_objects", "- CustomObjects: {custom_objects}\n"),
+    ("line_objects", "- LineObjects: {line_objects}\n"),
+    ("solid_objects", "- SolidObjects: {solid_objects}\n"),
+)
+_STATS_TAIL_TMPL = "- Max depth: {max_depth}\n"
+
+# Per-thread text buffer reused by the formatters that return a string
+_buffers = threading.local()
+
+# Recently formatted output keyed by (format_type, scene_version, id(result)).
+# Entries hold on to their result, so its id cannot be reused while cached
+_FORMAT_CACHE_SIZE = 8
+_format_cache = OrderedDict()
+
+# Description keys that may add decorations to a tree line (besides position)
+_DECORATION_KEYS = frozenset(("color", "creation", "draw", "scale"))
+
+# Tree drawing: connectors before a node, indents before its children
+_CONN_LAST = "└── "
+_CONN_MID = "├── "
+_IND_LAST = "    "
+_IND_MID = "│   "
+
+
+def format_json(hierarchy_result, pretty=True, fast=False):
     """
     Format hierarchy result as JSON string.
 
     Args:
         hierarchy_result: dict from describe_hierarchy()
+        pretty: indent by 2 spaces; False gives compact output without
+            whitespace, cheaper to produce and fewer tokens for an AI
+        fast: use orjson if installed. Same layout, but the output differs
+            from the stdlib's: NaN/Infinity become null, floats like 1e-05
+            are written as 0.00001 and non-ASCII text is not escaped
 
     Returns:
         JSON string
     """
-    return json.dumps(hierarchy_result, indent=2)
+    if fast and orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(hierarchy_result, option=option).decode("utf-8")
+    if pretty:
+        return json.dumps(hierarchy_result, indent=2)
+    return json.dumps(hierarchy_result, separators=(",", ":"))
 
 
 def format_markdown(hierarchy_result):
@@ -32,118 +85,186 @@ def format_markdown(hierarchy_result):
     Returns:
         Markdown string
     """
-    lines = []
+    out = _reused_buffer()
+    for chunk in format_markdown_iter(hierarchy_result):
+        out.write(chunk)
+    return _getvalue(out)
 
-    # Header
-    doc_name = hierarchy_result.get("document_name", "Untitled")
-    lines.append(f"# Scene: {doc_name}")
-    lines.append("")
 
-    # Summary
-    lines.append(f"**{hierarchy_result.get('summary', 'No objects')}**")
-    lines.append("")
+def format_markdown_iter(hierarchy_result):
+    """
+    Yield the markdown of format_markdown() in chunks.
+
+    Chunks are the header, one per top-level object subtree, and the stats,
+    so large scenes can be streamed without building the whole string.
+    Every line of every chunk ends with a newline.
+
+    Args:
+        hierarchy_result: dict from describe_hierarchy()
+
+    Yields:
+        Markdown text chunks
+    """
+    # Header and summary
+    doc_name = hierarchy_result.get("document_name", "Untitled")
+    yield f"# Scene: {doc_name}\n\n**{hierarchy_result.get('summary', 'No objects')}**\n\n"
 
     # Object tree
     if hierarchy_result.get("objects"):
-        lines.append("## Hierarchy")
-        lines.append("")
-        lines.append("```")
+        yield _MD_HIER_OPEN
 
         for obj in hierarchy_result["objects"]:
-            lines.extend(_format_object_tree(obj, prefix="", is_last=True))
+            out = io.StringIO()
+            _format_object_tree(obj, out, prefix="", is_last=True)
+            yield out.getvalue()
 
-        lines.append("```")
-        lines.append("")
+        yield _MD_HIER_CLOSE
 
     # Stats
     stats = hierarchy_result.get("stats", {})
     if stats:
-        lines.append("## Stats")
-        lines.append("")
-        lines.append(f"- Total objects: {stats.get('total_objects', 0)}")
-        if stats.get("custom_objects"):
-            lines.append(f"- CustomObjects: {stats['custom_objects']}")
-        if stats.get("line_objects"):
-            lines.append(f"- LineObjects: {stats['line_objects']}")
-        if stats.get("solid_objects"):
-            lines.append(f"- SolidObjects: {stats['solid_objects']}")
-        lines.append(f"- Max depth: {stats.get('max_depth', 0)}")
+        # Missing counts read as 0 without per-key .get calls
+        counts = defaultdict(int, stats)
+        stats_text = _STATS_HEAD_TMPL.format_map(counts)
+        for key, template in _STATS_TYPE_TMPLS:
+            if counts[key]:
+                stats_text += template.format_map(counts)
+        yield stats_text + _STATS_TAIL_TMPL.format_map(counts)
 
-    return "\n".join(lines)
 
+def _reused_buffer():
+    """
+    Return this thread's formatter buffer, emptied.
 
-def _format_object_tree(obj, prefix="", is_last=True):
+    Only for formatters that build their whole result before returning;
+    generators must not hold it across a yield.
     """
-    Recursively format an object and its children as a tree.
+    out = getattr(_buffers, "out", None)
+    if out is None:
+        out = _buffers.out = io.StringIO()
+    else:
+        out.seek(0)
+        out.truncate()
+    return out
 
-    Args:
-        obj: object description dict
-        prefix: current line prefix for indentation
-        is_last: whether this is the last sibling
 
-    Returns:
-        list of formatted lines
+def _getvalue(out):
     """
-    lines = []
+    Return buffered lines joined by newlines.
 
-    # Build the connector
-    connector = "└── " if is_last else "├── "
+    Every line is written with a trailing newline; the last one is dropped
+    so the result matches "\\n".join() of the same lines.
+    """
+    return out.getvalue()[:-1]
 
-    # Build object description line
-    name = obj.get("name", "Unknown")
-    obj_type = obj.get("type", "Unknown")
 
-    # Start with name and type
-    desc_parts = [f"{name} ({obj_type})"]
+def _format_object_tree(obj, out, prefix="", is_last=True):
+    """
+    Format an object and its children as a tree.
 
-    # Add position if not at origin
-    pos = obj.get("position", {})
-    if pos.get("x", 0) != 0 or pos.get("y", 0) != 0 or pos.get("z", 0) != 0:
-        desc_parts.append(f"@ ({pos.get('x', 0)}, {pos.get('y', 0)}, {pos.get('z', 0)})")
+    Walks the tree depth-first with an explicit stack, so deep hierarchies
+    don't pay a Python call per node or hit the recursion limit.
 
-    # Add color
-    if obj.get("color"):
-        desc_parts.append(f"[{obj['color']}]")
+    Args:
+        obj: object description dict
+        out: text buffer the formatted lines are written to
+        prefix: line prefix for indentation of obj
+        is_last: whether obj is the last sibling
+    """
+    write = out.write
+    stack = [(obj, prefix, is_last)]
+    while stack:
+        obj, prefix, is_last = stack.pop()
+
+        # Build the connector
+        connector = _CONN_LAST if is_last else _CONN_MID
+
+        # Read every field once
+        get = obj.get
+        name = get("name", "Unknown")
+        obj_type = get("type", "Unknown")
+        pos = get("position") or _EMPTY
+        px = pos.get("x", 0)
+        py = pos.get("y", 0)
+        pz = pos.get("z", 0)
+
+        # Fast path: most nodes sit at the origin without any decorations
+        if px == 0 and py == 0 and pz == 0 and obj.keys().isdisjoint(_DECORATION_KEYS):
+            write(f"{prefix}{connector}{name} ({obj_type})\n")
+        else:
+            color = get("color")
+            creation = get("creation")
+            draw = get("draw")
+            scale = get("scale")
+
+            # Start with name and type
+            write(f"{prefix}{connector}{name} ({obj_type})")
+
+            # Add position if not at origin
+            if px != 0 or py != 0 or pz != 0:
+                write(f" @ ({px}, {py}, {pz})")
 
-    # Add creation progress
-    if obj.get("creation") is not None:
-        desc_parts.append(f"creation:{obj['creation']}%")
+            # Add color
+            if color is not None:
+                write(f" [{color}]")
 
-    # Add draw progress
-    if obj.get("draw") is not None and obj.get("draw") != 100:
-        desc_parts.append(f"draw:{obj['draw']}%")
+            # Add creation progress
+            if creation is not None:
+                write(f" creation:{creation}%")
 
-    # Add scale if non-default
-    if obj.get("scale") and obj["scale"] != 1:
-        desc_parts.append(f"scale:{obj['scale']}")
+            # Add draw progress
+            if draw is not None and draw != 100:
+                write(f" draw:{draw}%")
 
-    line = prefix + connector + " ".join(desc_parts)
-    lines.append(line)
+            # Add scale if non-default
+            if scale is not None and scale != 1:
+                write(f" scale:{scale}")
 
-    # Process children
-    children = obj.get("children", [])
-    if children:
-        # Update prefix for children
-        child_prefix = prefix + ("    " if is_last else "│   ")
+            write("\n")
 
-        for i, child in enumerate(children):
-            child_is_last = (i == len(children) - 1)
-            lines.extend(_format_object_tree(child, child_prefix, child_is_last))
+        # Queue children in reverse so they pop in their original order
+        children = get("children")
+        if children:
+            # Update prefix for children
+            child_prefix = prefix + (_IND_LAST if is_last else _IND_MID)
 
-    return lines
+            stack.append((children[-1], child_prefix, True))
+            for child in reversed(children[:-1]):
+                stack.append((child, child_prefix, False))
 
 
-def format_for_ai(hierarchy_result, format_type="markdown"):
+def format_for_ai(hierarchy_result, format_type="markdown", scene_version=None):
     """
     Format hierarchy result for AI consumption.
 
     Args:
         hierarchy_result: dict from describe_hierarchy()
         format_type: "markdown" or "json"
+        scene_version: Optional token from get_scene_version(). When given,
+            output is cached per (format_type, scene_version) and result
+            object, so re-formatting the same result skips the tree walk.
+            A result that is mutated in place is not noticed.
 
     Returns:
         Formatted string
     """
+    if scene_version is None:
+        return _format_for_ai(hierarchy_result, format_type)
+
+    key = (format_type, scene_version, id(hierarchy_result))
+    entry = _format_cache.get(key)
+    if entry is None or entry[0] is not hierarchy_result:
+        text = _format_for_ai(hierarchy_result, format_type)
+        _format_cache[key] = (hierarchy_result, text)
+        if len(_format_cache) > _FORMAT_CACHE_SIZE:
+            _format_cache.popitem(last=False)
+        return text
+    _format_cache.move_to_end(key)
+    return entry[1]
+
+
+def _format_for_ai(hierarchy_result, format_type):
+    """Format hierarchy result without caching."""
     if format_type == "json":
         return format_json(hierarchy_result)
     else:
@@ -162,24 +283,27 @@ def format_compact(hierarchy_result):
     Returns:
         Single line summary string
     """
-    stats = hierarchy_result.get("stats", {})
+    stats = hierarchy_result.get("stats", _EMPTY)
     doc_name = hierarchy_result.get("document_name", "Untitled")
 
-    parts = [f"Scene: {doc_name}"]
-    parts.append(f"{stats.get('total_objects', 0)} objects")
+    summary = f"Scene: {doc_name} | {stats.get('total_objects', 0)} objects"
 
-    type_counts = []
-    if stats.get("custom_objects"):
-        type_counts.append(f"{stats['custom_objects']}C")
-    if stats.get("line_objects"):
-        type_counts.append(f"{stats['line_objects']}L")
-    if stats.get("solid_objects"):
-        type_counts.append(f"{stats['solid_objects']}S")
+    # Type counts like "2C/5L", only for non-zero counts
+    type_counts = ""
+    custom = stats.get("custom_objects")
+    if custom:
+        type_counts = f"{custom}C"
+    lines = stats.get("line_objects")
+    if lines:
+        type_counts += f"/{lines}L" if type_counts else f"{lines}L"
+    solids = stats.get("solid_objects")
+    if solids:
+        type_counts += f"/{solids}S" if type_counts else f"{solids}S"
 
     if type_counts:
-        parts.append(f"({'/'.join(type_counts)})")
+        summary += f" | ({type_counts})"
 
-    return " | ".join(parts)
+    return summary
 
 
 def format_inspect_object(result):
@@ -195,71 +319,77 @@ def format_inspect_object(result):
     if "error" in result:
         return f"**Error:** {result['error']}"
 
-    lines = []
-    lines.append(f"# Object: {result['name']}")
-    lines.append("")
-    lines.append(f"**Type:** {result['type']} ({result.get('c4d_type', 'Unknown')})")
-    lines.append("")
+    out = _reused_buffer()
+    write = out.write
+    get = result.get
+    write(f"# Object: {result['name']}\n"
+          "\n"
+          f"**Type:** {result['type']} ({get('c4d_type', 'Unknown')})\n"
+          "\n")
 
     # Transform
-    t = result.get("transform", {})
-    pos = t.get("position", {})
-    rot = t.get("rotation", {})
-    scale = t.get("scale", {})
-    lines.append("## Transform")
-    lines.append(f"- Position: ({pos.get('x', 0)}, {pos.get('y', 0)}, {pos.get('z', 0)})")
-    lines.append(f"- Rotation: ({rot.get('h', 0)}°, {rot.get('p', 0)}°, {rot.get('b', 0)}°)")
-    lines.append(f"- Scale: ({scale.get('x', 1)}, {scale.get('y', 1)}, {scale.get('z', 1)})")
-    lines.append("")
+    t = get("transform", _EMPTY)
+    pos = t.get("position", _EMPTY)
+    rot = t.get("rotation", _EMPTY)
+    scale = t.get("scale", _EMPTY)
+    write("## Transform\n"
+          f"- Position: ({pos.get('x', 0)}, {pos.get('y', 0)}, {pos.get('z', 0)})\n"
+          f"- Rotation: ({rot.get('h', 0)}°, {rot.get('p', 0)}°, {rot.get('b', 0)}°)\n"
+          f"- Scale: ({scale.get('x', 1)}, {scale.get('y', 1)}, {scale.get('z', 1)})\n"
+          "\n")
 
     # Hierarchy
-    if result.get("parent") or result.get("children"):
-        lines.append("## Hierarchy")
-        if result.get("parent"):
-            lines.append(f"- Parent: {result['parent']}")
-        if result.get("children"):
-            lines.append(f"- Children: {', '.join(result['children'])}")
-        lines.append("")
+    parent = get("parent")
+    children = get("children")
+    if parent or children:
+        write("## Hierarchy\n")
+        if parent:
+            write(f"- Parent: {parent}\n")
+        if children:
+            write(f"- Children: {', '.join(children)}\n")
+        write("\n")
 
     # Color
-    if result.get("color"):
-        c = result["color"]
-        lines.append("## Color")
-        lines.append(f"- Name: {c.get('name', 'Unknown')}")
+    c = get("color")
+    if c:
+        write("## Color\n")
+        write(f"- Name: {c.get('name', 'Unknown')}\n")
         rgb = c.get("rgb", {})
-        lines.append(f"- RGB: ({rgb.get('r', 0)}, {rgb.get('g', 0)}, {rgb.get('b', 0)})")
-        lines.append("")
+        write(f"- RGB: ({rgb.get('r', 0)}, {rgb.get('g', 0)}, {rgb.get('b', 0)})\n")
+        write("\n")
 
     # Userdata
-    if result.get("userdata"):
-        lines.append("## Parameters")
-        for group, params in result["userdata"].items():
-            lines.append(f"### {group}")
+    userdata = get("userdata")
+    if userdata:
+        write("## Parameters\n")
+        for group, params in userdata.items():
+            write(f"### {group}\n")
             for name, value in params.items():
                 if isinstance(value, dict):
                     value = f"({value.get('x', 0)}, {value.get('y', 0)}, {value.get('z', 0)})"
                 elif isinstance(value, float):
                     value = round(value, 3)
-                lines.append(f"- {name}: {value}")
-        lines.append("")
+                write(f"- {name}: {value}\n")
+        write("\n")
 
     # Tags
-    if result.get("tags"):
-        lines.append("## Tags")
-        for tag in result["tags"]:
+    tags = get("tags")
+    if tags:
+        write("## Tags\n")
+        for tag in tags:
             tag_line = f"- {tag['type']}"
             if tag.get("material"):
                 tag_line += f" → {tag['material']}"
-            lines.append(tag_line)
-        lines.append("")
+            write(tag_line + "\n")
+        write("\n")
 
     # Bounding box
-    if result.get("bounding_box"):
-        bb = result["bounding_box"]
-        lines.append("## Bounding Box")
-        lines.append(f"- Size: {bb.get('width', 0)} × {bb.get('height', 0)} × {bb.get('depth', 0)}")
+    bb = get("bounding_box")
+    if bb:
+        write("## Bounding Box\n")
+        write(f"- Size: {bb.get('width', 0)} × {bb.get('height', 0)} × {bb.get('depth', 0)}\n")
 
-    return "\n".join(lines)
+    return _getvalue(out)
 
 
 def format_inspect_materials(result):
@@ -272,68 +402,77 @@ def format_inspect_materials(result):
     Returns:
         Markdown string
     """
-    lines = []
-    lines.append(f"# Materials ({result.get('count', 0)})")
-    lines.append("")
-    lines.append(f"**{result.get('summary', 'No materials')}**")
-    lines.append("")
+    out = _reused_buffer()
+    write = out.write
+    write(f"# Materials ({result.get('count', 0)})\n")
+    write("\n")
+    write(f"**{result.get('summary', 'No materials')}**\n")
+    write("\n")
 
     for mat in result.get("materials", []):
-        lines.append(f"## {mat['name']}")
-        lines.append(f"- Type: {mat.get('type', 'Unknown')}")
+        write(f"## {mat['name']}\n")
+        write(f"- Type: {mat.get('type', 'Unknown')}\n")
 
         if mat.get("color"):
             c = mat["color"]
-            lines.append(f"- Color: {c.get('name', 'Unknown')}")
+            write(f"- Color: {c.get('name', 'Unknown')}\n")
 
         if mat.get("has_transparency"):
-            lines.append("- Has transparency")
+            write("- Has transparency\n")
         if mat.get("has_luminance"):
-            lines.append("- Has luminance/glow")
+            write("- Has luminance/glow\n")
 
         if mat.get("used_by"):
-            lines.append(f"- Used by: {', '.join(mat['used_by'])}")
+            write(f"- Used by: {', '.join(mat['used_by'])}\n")
         else:
-            lines.append("- **Not used**")
+            write("- **Not used**\n")
 
-        lines.append("")
+        write("\n")
 
-    return "\n".join(lines)
+    return _getvalue(out)
 
 
-def format_inspect_animation(result):
+def format_inspect_animation(result, detail="full"):
     """
     Format inspect_animation result as markdown.
 
     Args:
         result: dict from inspect_animation()
+        detail: "full" lists the first keyframes of each track,
+            "summary" only their count
 
     Returns:
         Markdown string
     """
-    lines = []
+    out = _reused_buffer()
+    write = out.write
     fr = result.get("frame_range", {})
-    lines.append(f"# Animation: Frames {fr.get('start', 0)} - {fr.get('end', 0)}")
-    lines.append("")
-    lines.append(f"**{result.get('summary', 'No animation')}**")
-    lines.append("")
-    lines.append(f"- FPS: {result.get('fps', 30)}")
-    lines.append(f"- Duration: {result.get('duration_seconds', 0)}s")
-    lines.append("")
-
+    write(f"# Animation: Frames {fr.get('start', 0)} - {fr.get('end', 0)}\n")
+    write("\n")
+    write(f"**{result.get('summary', 'No animation')}**\n")
+    write("\n")
+    write(f"- FPS: {result.get('fps', 30)}\n")
+    write(f"- Duration: {result.get('duration_seconds', 0)}s\n")
+    write("\n")
+
+    summary_only = detail == "summary"
     for obj in result.get("animated_objects", []):
-        lines.append(f"## {obj['name']} ({obj.get('type', 'Unknown')})")
+        write(f"## {obj['name']} ({obj.get('type', 'Unknown')})\n")
         for track in obj.get("tracks", []):
             param = track.get("parameter", "Unknown")
             keyframes = track.get("keyframes", [])
-            if keyframes:
+            if keyframes and summary_only:
+                write(f"- {param}: {len(keyframes)} keyframes\n")
+            elif keyframes:
                 kf_summary = ", ".join([f"f{kf['frame']}={kf['value']}" for kf in keyframes[:5]])
-                if len(keyframes) > 5:
-                    kf_summary += f" ... (+{len(keyframes) - 5} more)"
-                lines.append(f"- {param}: {kf_summary}")
-        lines.append("")
+                extra = len(keyframes) - 5
+                if extra > 0:
+                    write(f"- {param}: {kf_summary} ... (+{extra} more)\n")
+                else:
+                    write(f"- {param}: {kf_summary}\n")
+        write("\n")
 
-    return "\n".join(lines)
+    return _getvalue(out)
 
 
 def format_validate_scene(result):
@@ -346,39 +485,40 @@ def format_validate_scene(result):
     Returns:
         Markdown string
     """
-    lines = []
+    out = _reused_buffer()
+    write = out.write
     status = "✅ PASSED" if result.get("valid") else "❌ FAILED"
-    lines.append(f"# Scene Validation: {status}")
-    lines.append("")
-    lines.append(f"**{result.get('summary', 'No validation')}**")
-    lines.append("")
+    write(f"# Scene Validation: {status}\n")
+    write("\n")
+    write(f"**{result.get('summary', 'No validation')}**\n")
+    write("\n")
 
     if result.get("issues"):
-        lines.append("## Issues (must fix)")
+        write("## Issues (must fix)\n")
         for issue in result["issues"]:
-            lines.append(f"- ❌ {issue}")
-        lines.append("")
+            write(f"- ❌ {issue}\n")
+        write("\n")
 
     if result.get("warnings"):
-        lines.append("## Warnings")
+        write("## Warnings\n")
         for warning in result["warnings"]:
-            lines.append(f"- ⚠️ {warning}")
-        lines.append("")
+            write(f"- ⚠️ {warning}\n")
+        write("\n")
 
     if result.get("info"):
-        lines.append("## Info")
+        write("## Info\n")
         for info in result["info"]:
-            lines.append(f"- ℹ️ {info}")
-        lines.append("")
+            write(f"- ℹ️ {info}\n")
+        write("\n")
 
     stats = result.get("stats", {})
     if stats:
-        lines.append("## Stats")
-        lines.append(f"- Materials: {stats.get('material_count', 0)}")
+        write("## Stats\n")
+        write(f"- Materials: {stats.get('material_count', 0)}\n")
         if stats.get("unused_materials"):
-            lines.append(f"- Unused materials: {stats['unused_materials']}")
+            write(f"- Unused materials: {stats['unused_materials']}\n")
 
-    return "\n".join(lines)
+    return _getvalue(out)
 
 
 def format_describe_scene(result):
@@ -393,100 +533,105 @@ def format_describe_scene(result):
     Returns:
         Markdown string
     """
-    lines = []
+    out = _reused_buffer()
+    write = out.write
+    get = result.get
 
     # Header with scene name and frame info
-    doc_name = result.get("document_name", "Untitled")
-    frame = result.get("frame", {})
-    lines.append(f"# Scene: {doc_name}")
-    lines.append(f"Frame {frame.get('current', 0)}/{frame.get('end', 0)} @ {frame.get('fps', 30)}fps")
-    lines.append("")
+    doc_name = get("document_name", "Untitled")
+    frame = get("frame", _EMPTY)
+    write(f"# Scene: {doc_name}\n"
+          f"Frame {frame.get('current', 0)}/{frame.get('end', 0)} @ {frame.get('fps', 30)}fps\n"
+          "\n")
 
     # Changes section (most important - at top)
-    changes = result.get("changes")
+    changes = get("changes")
     if changes:
-        lines.append("## Changes Detected")
-        lines.append("")
-        _format_changes(changes, lines)
-        lines.append("")
-    elif result.get("changes") is None:
-        lines.append("*First inspection - baseline captured for change detection*")
-        lines.append("")
+        write("## Changes Detected\n\n")
+        _format_changes(changes, out)
+        write("\n")
+    elif changes is None:
+        write("*First inspection - baseline captured for change detection*\n\n")
 
     # Hierarchy
-    hierarchy = result.get("hierarchy", {})
+    hierarchy = get("hierarchy", _EMPTY)
     if hierarchy.get("objects"):
-        lines.append("## Hierarchy")
-        lines.append(f"*{hierarchy.get('summary', '')}*")
-        lines.append("")
+        write(f"## Hierarchy\n*{hierarchy.get('summary', '')}*\n\n")
         for obj in hierarchy["objects"]:
-            _format_object_compact(obj, lines, indent=0)
-        lines.append("")
+            _format_object_compact(obj, out, indent=0)
+        write("\n")
 
     # Materials (compact)
-    materials = result.get("materials", {})
+    materials = get("materials", _EMPTY)
     mat_list = materials.get("materials", [])
     if mat_list:
-        lines.append(f"## Materials ({len(mat_list)})")
+        write(f"## Materials ({len(mat_list)})\n")
         for mat in mat_list:
-            mat_line = f"- **{mat['name']}**"
-            if mat.get("color"):
-                mat_line += f" [{mat['color'].get('name', '')}]"
-            if mat.get("used_by"):
-                mat_line += f" → {', '.join(mat['used_by'])}"
+            write(f"- **{mat['name']}**")
+            color = mat.get("color")
+            if color:
+                write(f" [{color.get('name', '')}]")
+            used_by = mat.get("used_by")
+            if used_by:
+                write(f" → {', '.join(used_by)}\n")
             else:
-                mat_line += " (unused)"
-            lines.append(mat_line)
-        lines.append("")
+                write(" (unused)\n")
+        write("\n")
 
     # Animation (compact)
-    animation = result.get("animation", {})
+    animation = get("animation", _EMPTY)
     animated = animation.get("animated_objects", [])
     if animated:
-        lines.append(f"## Animation")
-        lines.append(f"*{animation.get('summary', '')}*")
+        write(f"## Animation\n*{animation.get('summary', '')}*\n")
         for obj in animated:
             tracks_summary = ", ".join([t.get("parameter", "?") for t in obj.get("tracks", [])])
-            lines.append(f"- {obj['name']}: {tracks_summary}")
-        lines.append("")
+            write(f"- {obj['name']}: {tracks_summary}\n")
+        write("\n")
 
     # Validation warnings (compact)
-    validation = result.get("validation", {})
+    validation = get("validation", _EMPTY)
     warnings = validation.get("warnings", [])
     issues = validation.get("issues", [])
     if warnings or issues:
-        lines.append("## Validation")
+        write("## Validation\n")
         for issue in issues:
-            lines.append(f"- ❌ {issue}")
+            write(f"- ❌ {issue}\n")
         for warning in warnings:
-            lines.append(f"- ⚠️ {warning}")
-        lines.append("")
+            write(f"- ⚠️ {warning}\n")
+        write("\n")
 
     # Console output delta (only if there are new messages)
-    console = result.get("console", {})
+    console = get("console", _EMPTY)
     if console.get("has_new"):
-        lines.append("## Console Output")
+        write("## Console Output\n")
         if console.get("truncated"):
-            lines.append("*Output truncated for safety*")
+            write("*Output truncated for safety*\n")
         for msg in console.get("messages", []):
             text = msg.get("text", "")
             count = msg.get("count", 1)
             # Format with repetition count if repeated
             if count > 1:
-                lines.append(f"- `{text}` (×{count})")
+                write(f"- `{text}` (×{count})\n")
             else:
-                lines.append(f"- `{text}`")
-        lines.append("")
+                write(f"- `{text}`\n")
+        write("\n")
+
+    return _getvalue(out)
+
 
-    return "\n".join(lines)
+def _fmt_val(value):
+    """Round floats for display in change listings, pass anything else through."""
+    return round(value, 3) if isinstance(value, float) else value
 
 
-def _format_changes(changes_result, lines):
+def _format_changes(changes_result, out):
     """Format change detection results.
 
     Handles both DreamTalk param changes and native C4D param changes.
     Native changes include the DescID for direct use in code.
+    Lines are written to the text buffer out.
     """
+    write = out.write
     changes = changes_result.get("changes", {})
 
     # Object changes
@@ -496,31 +641,21 @@ def _format_changes(changes_result, lines):
     if obj_changes.get("dreamtalk_modified"):
         for obj_name, params in obj_changes["dreamtalk_modified"].items():
             for param, vals in params.items():
-                old_val = vals.get('old')
-                new_val = vals.get('new')
-                # Format values nicely
-                if isinstance(old_val, float):
-                    old_val = round(old_val, 3)
-                if isinstance(new_val, float):
-                    new_val = round(new_val, 3)
-                lines.append(f"- **{obj_name}**.{param}: `{old_val}` → `{new_val}`")
+                old_val = _fmt_val(vals.get('old'))
+                new_val = _fmt_val(vals.get('new'))
+                write(f"- **{obj_name}**.{param}: `{old_val}` → `{new_val}`\n")
 
     # Native C4D param changes (only shown when changed)
     if obj_changes.get("native_modified"):
         for obj_name, params in obj_changes["native_modified"].items():
             for desc_id_str, vals in params.items():
-                old_val = vals.get('old')
-                new_val = vals.get('new')
-                param_name = vals.get('name', '')
-                ident = vals.get('ident', '')
-                old_label = vals.get('old_label')
-                new_label = vals.get('new_label')
-
-                # Format values nicely
-                if isinstance(old_val, float):
-                    old_val = round(old_val, 3)
-                if isinstance(new_val, float):
-                    new_val = round(new_val, 3)
+                get = vals.get
+                old_val = _fmt_val(get('old'))
+                new_val = _fmt_val(get('new'))
+                param_name = get('name', '')
+                ident = get('ident', '')
+                old_label = get('old_label')
+                new_label = get('new_label')
 
                 # Build the change description
                 # If we have labels (dropdown/enum), show "Label (value)"
@@ -541,58 +676,72 @@ def _format_changes(changes_result, lines):
                 else:
                     param_display = f"DescID {desc_id_str}"
 
-                lines.append(f"- **{obj_name}**.{param_display}: `{old_display}` → `{new_display}`")
+                write(f"- **{obj_name}**.{param_display}: `{old_display}` → `{new_display}`\n")
 
     # Added/removed objects
     if obj_changes.get("added"):
         for name in obj_changes["added"]:
-            lines.append(f"- **+ Added**: {name}")
+            write(f"- **+ Added**: {name}\n")
 
     if obj_changes.get("removed"):
         for name in obj_changes["removed"]:
-            lines.append(f"- **- Removed**: {name}")
+            write(f"- **- Removed**: {name}\n")
 
     # Material changes
     mat_changes = changes.get("materials", {})
     if mat_changes.get("modified"):
         for mat_name, params in mat_changes["modified"].items():
             for param, vals in params.items():
-                lines.append(f"- Material **{mat_name}**.{param}: `{vals.get('old')}` → `{vals.get('new')}`")
+                write(f"- Material **{mat_name}**.{param}: `{vals.get('old')}` → `{vals.get('new')}`\n")
 
     if mat_changes.get("added"):
         for name in mat_changes["added"]:
-            lines.append(f"- **+ Added Material**: {name}")
+            write(f"- **+ Added Material**: {name}\n")
 
     if mat_changes.get("removed"):
         for name in mat_changes["removed"]:
-            lines.append(f"- **- Removed Material**: {name}")
-
-
-def _format_object_compact(obj, lines, indent=0):
-    """Format a single object compactly with its key parameters."""
-    prefix = "  " * indent
+            write(f"- **- Removed Material**: {name}\n")
 
-    # Build object line
-    name = obj.get("name", "Unknown")
-    obj_type = obj.get("type", "Unknown")
 
-    parts = [f"{name} ({obj_type})"]
-
-    # Position (only if non-zero)
-    pos = obj.get("position", {})
-    if pos.get("x", 0) != 0 or pos.get("y", 0) != 0 or pos.get("z", 0) != 0:
-        parts.append(f"@ ({pos.get('x', 0)}, {pos.get('y', 0)}, {pos.get('z', 0)})")
-
-    # Key DreamTalk params
-    if obj.get("creation") is not None:
-        parts.append(f"creation:{obj['creation']}%")
-    if obj.get("draw") is not None and obj.get("draw") != 100:
-        parts.append(f"draw:{obj['draw']}%")
-    if obj.get("color"):
-        parts.append(f"[{obj['color']}]")
-
-    lines.append(f"{prefix}- {' '.join(parts)}")
+def _format_object_compact(obj, out, indent=0):
+    """
+    Format an object compactly with its key parameters, then its children.
 
-    # Recurse children
-    for child in obj.get("children", []):
-        _format_object_compact(child, lines, indent + 1)
+    Walks the subtree with an explicit stack; each child prefix is built
+    once per parent and shared by all of its children.
+    """
+    write = out.write
+    stack = [(obj, "  " * indent)]
+    while stack:
+        obj, prefix = stack.pop()
+
+        # Object line, written piecewise instead of joining a parts list
+        get = obj.get
+        write(f"{prefix}- {get('name', 'Unknown')} ({get('type', 'Unknown')})")
+
+        # Position (only if non-zero)
+        pos = get("position") or _EMPTY
+        px = pos.get("x", 0)
+        py = pos.get("y", 0)
+        pz = pos.get("z", 0)
+        if px != 0 or py != 0 or pz != 0:
+            write(f" @ ({px}, {py}, {pz})")
+
+        # Key DreamTalk params
+        creation = get("creation")
+        if creation is not None:
+            write(f" creation:{creation}%")
+        draw = get("draw")
+        if draw is not None and draw != 100:
+            write(f" draw:{draw}%")
+        color = get("color")
+        if color is not None:
+            write(f" [{color}]")
+
+        write("\n")
+
+        # Queue children in reverse so they pop in their original order
+        children = get("children")
+        if children:
+            child_prefix = prefix + "  "
+            stack.extend((child, child_prefix) for child in reversed(children))
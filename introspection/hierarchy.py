@@ -4,21 +4,36 @@ Hierarchy Introspection
 Walks Cinema 4D document and extracts semantic information about DreamTalk objects.
 """
 
+import math
+
 import c4d
 
 
-# DreamTalk object type detection
-DREAMTALK_TYPES = {
+# DreamTalk object type detection, by default object name
+_LINE_OBJECT_NAMES = (
     # LineObjects (spline-based)
     "Circle", "Rectangle", "Arc", "Spline", "SVG", "SplineText", "Line",
     "Arrow", "Brace", "NSide", "Helix", "Formula",
+)
+_SOLID_OBJECT_NAMES = (
     # SolidObjects (3D)
     "Sphere", "Cylinder", "Cube", "Plane", "Cone", "Torus", "Capsule",
     "Pyramid", "Platonic", "Disc", "Tube", "Landscape", "Figure",
+)
+_CUSTOM_OBJECT_NAMES = (
     # CustomObjects (composites) - common ones
     "Connection", "Group", "Membrane", "Morpher",
     # Known sovereign symbols
     "Fire", "Human", "Campfire", "Camp",
+)
+
+DREAMTALK_TYPES = frozenset(_LINE_OBJECT_NAMES + _SOLID_OBJECT_NAMES + _CUSTOM_OBJECT_NAMES)
+
+# Expected DreamTalk class of an object carrying one of the names above
+_NAME_TO_CLASS = {
+    **dict.fromkeys(_LINE_OBJECT_NAMES, "LineObject"),
+    **dict.fromkeys(_SOLID_OBJECT_NAMES, "SolidObject"),
+    **dict.fromkeys(_CUSTOM_OBJECT_NAMES, "CustomObject"),
 }
 
 
@@ -33,8 +48,9 @@ def get_userdata_value(obj, group_name, param_name):
         return None
 
     # Find the parameter by name within the group
+    desc_name = c4d.DESC_NAME
     for desc_id, bc in ud:
-        name = bc.GetString(c4d.DESC_NAME)
+        name = bc.GetString(desc_name)
         if name == param_name:
             try:
                 return obj[desc_id]
@@ -47,21 +63,59 @@ def get_userdata_groups(obj):
     """
     Get all userdata group names on an object.
 
-    Returns list of group names.
+    Returns frozenset of group names.
     """
-    groups = []
+    groups = set()
     ud = obj.GetUserDataContainer()
     if not ud:
-        return groups
+        return frozenset(groups)
 
+    desc_name = c4d.DESC_NAME
     for desc_id, bc in ud:
         # Groups have dtype=1 (DTYPE_GROUP) and customgui=0
         dtype = desc_id[1].dtype if len(desc_id) > 1 else 0
         if dtype == 1:  # c4d.DTYPE_GROUP
-            name = bc.GetString(c4d.DESC_NAME)
+            name = bc.GetString(desc_name)
             if name:
-                groups.append(name)
-    return groups
+                groups.add(name)
+    return frozenset(groups)
+
+
+def _scan_userdata(obj):
+    """
+    Walk an object's userdata container once.
+
+    Returns (groups, desc_ids): the group names, as get_userdata_groups()
+    returns them, and a dict mapping each entry name to the DescID of its
+    first occurrence, the entry get_userdata_value() would read.
+    """
+    groups = set()
+    desc_ids = {}
+    ud = obj.GetUserDataContainer()
+    if not ud:
+        return frozenset(groups), desc_ids
+
+    desc_name = c4d.DESC_NAME
+    for desc_id, bc in ud:
+        name = bc.GetString(desc_name)
+        if name not in desc_ids:
+            desc_ids[name] = desc_id
+        # Groups have dtype=1 (DTYPE_GROUP)
+        dtype = desc_id[1].dtype if len(desc_id) > 1 else 0
+        if dtype == 1 and name:
+            groups.add(name)
+    return frozenset(groups), desc_ids
+
+
+def _read_userdata(obj, desc_ids, param_name):
+    """Read a userdata value from a _scan_userdata() index, None if absent."""
+    desc_id = desc_ids.get(param_name)
+    if desc_id is None:
+        return None
+    try:
+        return obj[desc_id]
+    except:
+        return None
 
 
 def _get_c4d_type(name, default=None):
@@ -69,102 +123,196 @@ def _get_c4d_type(name, default=None):
     return getattr(c4d, name, default)
 
 
-def detect_dreamtalk_class(obj):
+def _c4d_type_set(names):
+    """Frozenset of the named c4d type constants that exist in this version."""
+    return frozenset(t for t in (_get_c4d_type(n) for n in names) if t is not None)
+
+
+# Type constants used while walking the scene, resolved once at import
+_OCAMERA = _get_c4d_type('Ocamera')
+_OLIGHT = _get_c4d_type('Olight')
+_ONULL = _get_c4d_type('Onull')
+_MSKETCH = _get_c4d_type('Msketch')
+_OPYTHON = 1023866        # Python Generator
+_OCLONER = 1018544        # MoGraph Cloner
+_TSKETCHSTYLE = 1011012   # Sketch Style Tag
+
+_SPLINE_TYPES = _c4d_type_set((
+    'Ospline', 'Osplinecircle', 'Osplinerectangle',
+    'Osplinearc', 'Osplinetext', 'Osplinehelix',
+    'Osplinenside', 'Osplineformula', 'Ospline4side'))
+
+_SOLID_TYPES = _c4d_type_set((
+    'Osphere', 'Ocylinder', 'Ocube', 'Oplane',
+    'Ocone', 'Otorus', 'Ocapsule', 'Opyramid',
+    'Oplatonic', 'Odisc', 'Otube'))
+
+
+_SOLID_SIGNATURE = frozenset(("Solid", "Sketch"))
+
+
+def _has_actions_group(groups):
+    """
+    Whether groups holds the Actions group of a CustomObject.
+
+    Current holons name it exactly "Actions"; legacy ones prefix it with the
+    holon name ("MyHolonActions"), which only the substring scan catches.
+    """
+    return "Actions" in groups or any("Actions" in g for g in groups)
+
+
+def detect_dreamtalk_class(obj, groups=None):
     """
     Detect what type of DreamTalk object this is based on heuristics.
 
+    Args:
+        obj: Cinema 4D BaseObject
+        groups: userdata group names of obj, if already scanned
+
     Returns one of: "CustomObject", "LineObject", "SolidObject", "Camera", "Light", "Unknown"
     """
     obj_type = obj.GetType()
     obj_name = obj.GetName()
 
+    # Fast path: a well-named object only needs its expected class's
+    # signature confirmed. Each check implies every earlier heuristic
+    # below fails, so a hit returns what the full chain would.
+    expected = _NAME_TO_CLASS.get(obj_name)
+    if expected is not None:
+        if groups is None:
+            groups = get_userdata_groups(obj)
+        if expected == "LineObject":
+            if obj_type in _SPLINE_TYPES and "Sketch" in groups:
+                return expected
+        elif expected == "SolidObject":
+            if obj_type in _SOLID_TYPES and _SOLID_SIGNATURE <= groups:
+                return expected
+        elif obj_type == _ONULL and _has_actions_group(groups):
+            return expected
+
     # Camera
-    if obj_type == _get_c4d_type('Ocamera'):
+    if obj_type == _OCAMERA:
         return "Camera"
 
     # Light
-    if obj_type == _get_c4d_type('Olight'):
+    if obj_type == _OLIGHT:
         return "Light"
 
     # Python Generator (holon container)
-    if obj_type == 1023866:
+    if obj_type == _OPYTHON:
         return "Generator"
 
     # Check userdata for DreamTalk signatures
-    groups = get_userdata_groups(obj)
+    if groups is None:
+        groups = get_userdata_groups(obj)
 
     # CustomObject signature: has Actions group with Creation parameter
-    if any("Actions" in g for g in groups):
-        # Check if it's a Null (CustomObjects are Nulls with children)
-        if obj_type == _get_c4d_type('Onull'):
-            return "CustomObject"
+    # Check if it's a Null (CustomObjects are Nulls with children)
+    if obj_type == _ONULL and _has_actions_group(groups):
+        return "CustomObject"
 
     # LineObject signature: Sketch group with Draw parameter
     if "Sketch" in groups:
         # Splines are LineObjects
-        spline_types = [_get_c4d_type(t) for t in
-                       ('Ospline', 'Osplinecircle', 'Osplinerectangle',
-                        'Osplinearc', 'Osplinetext', 'Osplinehelix',
-                        'Osplinenside', 'Osplineformula', 'Ospline4side')
-                       if _get_c4d_type(t) is not None]
-        if obj_type in spline_types:
+        if obj_type in _SPLINE_TYPES:
             return "LineObject"
 
     # SolidObject signature: has both Fill and Sketch groups
-    if "Solid" in groups and "Sketch" in groups:
+    if _SOLID_SIGNATURE <= groups:
         return "SolidObject"
 
     # Fall back to C4D type-based detection
-    if obj_type == _get_c4d_type('Onull'):
+    if obj_type == _ONULL:
         # Null with children might be a CustomObject without full setup
         if obj.GetDown():
             return "CustomObject"
         return "Null"
 
     # Check if spline type
-    spline_types = [_get_c4d_type(t) for t in
-                   ('Ospline', 'Osplinecircle', 'Osplinerectangle',
-                    'Osplinearc', 'Osplinetext', 'Osplinehelix',
-                    'Osplinenside', 'Osplineformula', 'Ospline4side')
-                   if _get_c4d_type(t) is not None]
-    if obj_type in spline_types:
+    if obj_type in _SPLINE_TYPES:
         return "LineObject"
 
     # Check if solid/primitive type
-    solid_types = [_get_c4d_type(t) for t in
-                  ('Osphere', 'Ocylinder', 'Ocube', 'Oplane',
-                   'Ocone', 'Otorus', 'Ocapsule', 'Opyramid',
-                   'Oplatonic', 'Odisc', 'Otube')
-                  if _get_c4d_type(t) is not None]
-    if obj_type in solid_types:
+    if obj_type in _SOLID_TYPES:
         return "SolidObject"
 
     return "Unknown"
 
 
-def get_color_from_object(obj):
+def _classify(obj, groups=None, class_cache=None):
+    """
+    detect_dreamtalk_class(), memoized by object GUID in class_cache if given.
+
+    describe_scene() shares one cache across its sub-inspections, which
+    would otherwise classify the same objects up to three times.
+    """
+    if class_cache is None:
+        return detect_dreamtalk_class(obj, groups)
+    guid = obj.GetGUID()
+    dt_class = class_cache.get(guid)
+    if dt_class is None:
+        dt_class = class_cache[guid] = detect_dreamtalk_class(obj, groups)
+    return dt_class
+
+
+# Userdata colors by object GUID: guid -> (data dirty count, rgb or None)
+_UD_COLOR_CACHE_SIZE = 4096
+_ud_color_cache = {}
+
+
+def _userdata_color(obj, ud_desc_ids=None):
+    """
+    Read the userdata Color of obj as an (r, g, b) tuple, or None.
+
+    Memoized per object until its data dirty count changes, so repeated
+    scene descriptions skip the userdata lookup on unchanged objects.
+    """
+    guid = obj.GetGUID()
+    dirty = obj.GetDirty(c4d.DIRTYFLAGS_DATA)
+    cached = _ud_color_cache.get(guid)
+    if cached is not None and cached[0] == dirty:
+        return cached[1]
+
+    if ud_desc_ids is None:
+        color = get_userdata_value(obj, "Sketch", "Color")
+    else:
+        color = _read_userdata(obj, ud_desc_ids, "Color")
+    rgb = (color.x, color.y, color.z) if color and isinstance(color, c4d.Vector) else None
+
+    if len(_ud_color_cache) >= _UD_COLOR_CACHE_SIZE:
+        _ud_color_cache.clear()
+    _ud_color_cache[guid] = (dirty, rgb)
+    return rgb
+
+
+def get_color_from_object(obj, ud_desc_ids=None, tag_materials=None):
     """
     Try to extract the color from a DreamTalk object.
 
+    Args:
+        obj: Cinema 4D BaseObject
+        ud_desc_ids: userdata index of obj from _scan_userdata(), if already scanned
+        tag_materials: texture tag materials of obj from _scan_tags(), if already scanned
+
     Returns tuple (r, g, b) normalized 0-1, or None if not found.
     """
     # Try userdata Color parameter
-    color = get_userdata_value(obj, "Sketch", "Color")
-    if color and isinstance(color, c4d.Vector):
-        return (color.x, color.y, color.z)
-
-    # Try to get from material
-    tags = obj.GetTags()
-    for tag in tags:
-        if tag.GetType() == c4d.Ttexture:
-            mat = tag.GetMaterial()
-            if mat:
-                try:
-                    color = mat[c4d.MATERIAL_COLOR_COLOR]
-                    if color:
-                        return (color.x, color.y, color.z)
-                except:
-                    pass
+    rgb = _userdata_color(obj, ud_desc_ids)
+    if rgb is not None:
+        return rgb
+
+    # Try to get from material. Not memoized: editing a material leaves
+    # the object's dirty count untouched
+    if tag_materials is None:
+        tag_materials = _scan_tags(obj)[1]
+    color_id = c4d.MATERIAL_COLOR_COLOR
+    for mat in tag_materials:
+        try:
+            color = mat[color_id]
+            if color:
+                return (color.x, color.y, color.z)
+        except:
+            pass
     return None
 
 
@@ -175,48 +323,43 @@ def color_to_name(rgb):
 
     r, g, b = rgb
 
-    # Check for common DreamTalk colors
-    if r > 0.8 and g < 0.3 and b < 0.3:
-        return "RED"
-    if r < 0.3 and g < 0.3 and b > 0.8:
-        return "BLUE"
-    if r < 0.3 and g > 0.8 and b < 0.3:
-        return "GREEN"
-    if r > 0.8 and g > 0.8 and b < 0.3:
-        return "YELLOW"
-    if r > 0.8 and g < 0.5 and b > 0.8:
-        return "PURPLE"
-    if r > 0.8 and g > 0.4 and b < 0.3:
-        return "ORANGE"
-    if r > 0.8 and g > 0.8 and b > 0.8:
-        return "WHITE"
-    if r < 0.2 and g < 0.2 and b < 0.2:
-        return "BLACK"
+    # Check for common DreamTalk colors, split on the red channel first so
+    # each color only tests the rules that can still match
+    if r > 0.8:
+        if b < 0.3:
+            if g < 0.3:
+                return "RED"
+            if g > 0.8:
+                return "YELLOW"
+            if g > 0.4:
+                return "ORANGE"
+        elif b > 0.8:
+            if g < 0.5:
+                return "PURPLE"
+            if g > 0.8:
+                return "WHITE"
+    elif r < 0.3:
+        if g < 0.3 and b > 0.8:
+            return "BLUE"
+        if g > 0.8 and b < 0.3:
+            return "GREEN"
+        if r < 0.2 and g < 0.2 and b < 0.2:
+            return "BLACK"
 
     return f"rgb({r:.2f},{g:.2f},{b:.2f})"
 
 
-def describe_object(obj, depth=0, include_children=True):
-    """
-    Create a semantic description of a single object.
-
-    Args:
-        obj: Cinema 4D BaseObject
-        depth: Current depth in hierarchy (for indentation)
-        include_children: Whether to recursively describe children
-
-    Returns:
-        dict with object description
-    """
-    if obj is None:
-        return None
-
+def _describe_node(obj, depth, class_cache=None):
+    """Describe a single object, without its children."""
     pos = obj.GetAbsPos()
     rot = obj.GetAbsRot()
     scale = obj.GetAbsScale()
 
+    # One userdata walk serves the class, parameters and color
+    groups, ud_desc_ids = _scan_userdata(obj)
+
     # Get DreamTalk class
-    dt_class = detect_dreamtalk_class(obj)
+    dt_class = _classify(obj, groups, class_cache)
 
     # Build description
     desc = {
@@ -232,7 +375,6 @@ def describe_object(obj, depth=0, include_children=True):
 
     # Only include rotation/scale if non-default
     if abs(rot.x) > 0.01 or abs(rot.y) > 0.01 or abs(rot.z) > 0.01:
-        import math
         desc["rotation"] = {
             "h": round(math.degrees(rot.x), 1),
             "p": round(math.degrees(rot.y), 1),
@@ -243,47 +385,166 @@ def describe_object(obj, depth=0, include_children=True):
         desc["scale"] = round(scale.x, 2)  # Assume uniform scale
 
     # DreamTalk-specific info
-    creation = get_userdata_value(obj, "Actions", "Creation")
+    creation = _read_userdata(obj, ud_desc_ids, "Creation")
     if creation is not None:
         desc["creation"] = round(creation * 100, 1)  # As percentage
 
-    draw = get_userdata_value(obj, "Sketch", "Draw")
+    draw = _read_userdata(obj, ud_desc_ids, "Draw")
     if draw is not None:
         desc["draw"] = round(draw * 100, 1)
 
-    opacity = get_userdata_value(obj, "Sketch", "Opacity")
+    opacity = _read_userdata(obj, ud_desc_ids, "Opacity")
     if opacity is not None and opacity < 1.0:
         desc["opacity"] = round(opacity * 100, 1)
 
     # Color
-    color = get_color_from_object(obj)
+    color = get_color_from_object(obj, ud_desc_ids)
     color_name = color_to_name(color)
     if color_name:
         desc["color"] = color_name
 
-    # Children
-    if include_children:
-        children = []
-        child = obj.GetDown()
-        while child:
-            child_desc = describe_object(child, depth + 1, include_children=True)
-            if child_desc:
-                children.append(child_desc)
-            child = child.GetNext()
-
-        if children:
+    return desc
+
+
+# Stats counter incremented per DreamTalk class in describe_hierarchy
+_STATS_KEY_BY_CLASS = {
+    "CustomObject": "custom_objects",
+    "LineObject": "line_objects",
+    "SolidObject": "solid_objects",
+}
+
+
+def _describe_tree(obj, depth, include_children=True, stats=None, class_cache=None):
+    """
+    Describe an object and, optionally, its whole subtree.
+
+    Walks the tree depth-first with an explicit stack, so deep hierarchies
+    don't pay a Python call per node or hit the recursion limit. If stats
+    is given, it is updated for every object on the same pass.
+    """
+    described = []
+    stack = [(obj, depth, described)]
+    while stack:
+        obj, depth, siblings = stack.pop()
+        desc = _describe_node(obj, depth, class_cache)
+        siblings.append(desc)
+
+        if stats is not None:
+            stats["total_objects"] += 1
+            if depth > stats["max_depth"]:
+                stats["max_depth"] = depth
+            stats_key = _STATS_KEY_BY_CLASS.get(desc["type"])
+            if stats_key:
+                stats[stats_key] += 1
+
+        # Children; leaves stop at the first GetDown()
+        child = obj.GetDown() if include_children else None
+        if child is not None:
+            kids = []
+            while child:
+                kids.append(child)
+                child = child.GetNext()
+
+            children = []
             desc["children"] = children
-            desc["child_count"] = len(children)
+            desc["child_count"] = len(kids)
+            # Queue in reverse so siblings are described in order
+            stack.extend((kid, depth + 1, children) for kid in reversed(kids))
 
-    return desc
+    return described[0]
+
+
+def describe_object(obj, depth=0, include_children=True):
+    """
+    Create a semantic description of a single object.
+
+    Args:
+        obj: Cinema 4D BaseObject
+        depth: Current depth in hierarchy (for indentation)
+        include_children: Whether to recursively describe children
+
+    Returns:
+        dict with object description
+    """
+    if obj is None:
+        return None
+
+    return _describe_tree(obj, depth, include_children)
+
+
+# Root subtree descriptions from the last describe_hierarchy() call:
+# guid -> (dirty signature, description, subtree stats)
+_subtree_cache = {}
+# Material dirty counts the cached descriptions were built against
+_subtree_cache_materials = None
+
+_SUBTREE_DIRTY = c4d.DIRTYFLAGS_DATA | c4d.DIRTYFLAGS_MATRIX | c4d.DIRTYFLAGS_CHILDREN
+_SUBTREE_HDIRTY = (c4d.HDIRTYFLAGS_OBJECT | c4d.HDIRTYFLAGS_OBJECT_MATRIX |
+                   c4d.HDIRTYFLAGS_OBJECT_HIERARCHY)
+
+
+def _subtree_signature(obj):
+    """
+    Dirty counts that change whenever obj or anything below it changes.
+
+    Texture tags are included per object: switching a tag's material changes
+    the material fallback color without touching the object's dirty counts.
+    """
+    ttexture = c4d.Ttexture
+    tag_sig = []
+    for node in _walk_subtree(obj):
+        tag_sig.append(tuple(tag.GetDirty(c4d.DIRTYFLAGS_DATA)
+                             for tag in node.GetTags() if tag.GetType() == ttexture))
+    return (obj.GetDirty(_SUBTREE_DIRTY), obj.GetHDirty(_SUBTREE_HDIRTY), tuple(tag_sig))
+
+
+def _walk_subtree(obj):
+    """Yield obj and all its descendants, without obj's following siblings."""
+    yield obj
+    for child, _ in _walk(obj.GetDown()):
+        yield child
+
+
+def _copy_description(desc):
+    """
+    Copy a _describe_tree() result, so callers can't alter cached descriptions.
+
+    Nested dicts (position, rotation) are flat; the only list is children.
+    """
+    root = dict(desc)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for key, value in node.items():
+            if isinstance(value, dict):
+                node[key] = dict(value)
+            elif isinstance(value, list):
+                children = node[key] = [dict(child) for child in value]
+                stack.extend(children)
+    return root
+
+
+def _materials_signature(doc):
+    """Dirty counts of all materials, which can color objects via tags."""
+    sig = []
+    mat = doc.GetFirstMaterial()
+    while mat:
+        sig.append(mat.GetDirty(c4d.DIRTYFLAGS_DATA))
+        mat = mat.GetNext()
+    return tuple(sig)
 
 
-def describe_hierarchy(doc=None):
+def describe_hierarchy(doc=None, class_cache=None):
     """
     Generate a semantic description of the entire scene hierarchy.
 
+    Descriptions of unchanged root subtrees are reused from the previous
+    call. Each call returns its own copies, which callers may modify.
+
     Args:
         doc: Cinema 4D document (defaults to active document)
+        class_cache: dict memoizing object classes by GUID, shared between
+            inspections of the same unchanged scene
 
     Returns:
         dict with:
@@ -294,16 +555,6 @@ def describe_hierarchy(doc=None):
     if doc is None:
         doc = c4d.documents.GetActiveDocument()
 
-    # Collect root objects
-    root_objects = []
-    obj = doc.GetFirstObject()
-    while obj:
-        desc = describe_object(obj, depth=0)
-        if desc:
-            root_objects.append(desc)
-        obj = obj.GetNext()
-
-    # Calculate stats
     stats = {
         "total_objects": 0,
         "custom_objects": 0,
@@ -312,23 +563,37 @@ def describe_hierarchy(doc=None):
         "max_depth": 0,
     }
 
-    def count_recursive(objects, depth=0):
-        for o in objects:
-            stats["total_objects"] += 1
-            stats["max_depth"] = max(stats["max_depth"], depth)
-
-            obj_type = o.get("type", "Unknown")
-            if obj_type == "CustomObject":
-                stats["custom_objects"] += 1
-            elif obj_type == "LineObject":
-                stats["line_objects"] += 1
-            elif obj_type == "SolidObject":
-                stats["solid_objects"] += 1
+    # Root subtrees whose dirty counts haven't moved since the last call
+    # reuse their descriptions; any material change invalidates them all
+    global _subtree_cache, _subtree_cache_materials
+    materials_sig = _materials_signature(doc)
+    previous = _subtree_cache if materials_sig == _subtree_cache_materials else {}
+    cache = {}
 
-            if "children" in o:
-                count_recursive(o["children"], depth + 1)
+    # Collect root objects, counting stats on the same pass
+    root_objects = []
+    obj = doc.GetFirstObject()
+    while obj:
+        guid = obj.GetGUID()
+        sig = _subtree_signature(obj)
+        entry = previous.get(guid)
+        if entry is None or entry[0] != sig:
+            subtree_stats = dict.fromkeys(stats, 0)
+            desc = _describe_tree(obj, 0, stats=subtree_stats, class_cache=class_cache)
+            entry = (sig, desc, subtree_stats)
+        cache[guid] = entry
+
+        root_objects.append(_copy_description(entry[1]))
+        for key, count in entry[2].items():
+            if key == "max_depth":
+                stats[key] = max(stats[key], count)
+            else:
+                stats[key] += count
+        obj = obj.GetNext()
 
-    count_recursive(root_objects)
+    # Only keep the roots seen in this pass
+    _subtree_cache = cache
+    _subtree_cache_materials = materials_sig
 
     # Generate summary
     parts = []
@@ -353,6 +618,25 @@ def describe_hierarchy(doc=None):
     }
 
 
+def _walk(obj, depth=0):
+    """
+    Yield (object, depth) for obj, its following siblings and all their
+    descendants, in hierarchy order.
+
+    Uses an explicit stack instead of recursing per GetDown()/GetNext()
+    level, so deep scenes don't hit the recursion limit.
+    """
+    stack = [(obj, depth)]
+    while stack:
+        obj, depth = stack.pop()
+        if obj is None:
+            continue
+        yield obj, depth
+        # Children before the next sibling
+        stack.append((obj.GetNext(), depth))
+        stack.append((obj.GetDown(), depth + 1))
+
+
 def find_object_by_name(name, doc=None):
     """
     Find an object by name in the document.
@@ -367,17 +651,10 @@ def find_object_by_name(name, doc=None):
     if doc is None:
         doc = c4d.documents.GetActiveDocument()
 
-    def search_recursive(obj):
-        while obj:
-            if obj.GetName() == name:
-                return obj
-            found = search_recursive(obj.GetDown())
-            if found:
-                return found
-            obj = obj.GetNext()
-        return None
-
-    return search_recursive(doc.GetFirstObject())
+    for obj, _ in _walk(doc.GetFirstObject()):
+        if obj.GetName() == name:
+            return obj
+    return None
 
 
 def get_all_userdata(obj):
@@ -394,8 +671,10 @@ def get_all_userdata(obj):
     result = {}
     current_group = "Ungrouped"
 
+    desc_name = c4d.DESC_NAME
+    vector = c4d.Vector
     for desc_id, bc in ud:
-        name = bc.GetString(c4d.DESC_NAME)
+        name = bc.GetString(desc_name)
         dtype = desc_id[1].dtype if len(desc_id) > 1 else 0
 
         if dtype == 1:  # Group
@@ -407,7 +686,7 @@ def get_all_userdata(obj):
             try:
                 value = obj[desc_id]
                 # Convert c4d types to Python types
-                if isinstance(value, c4d.Vector):
+                if isinstance(value, vector):
                     value = {"x": value.x, "y": value.y, "z": value.z}
                 elif hasattr(value, '__float__'):
                     value = float(value)
@@ -428,23 +707,38 @@ def get_object_tags(obj):
     Returns:
         list of {name, type, details}
     """
+    return _scan_tags(obj, with_info=True)[0]
+
+
+def _scan_tags(obj, with_info=False):
+    """
+    Walk an object's tags once.
+
+    Returns (tag_infos, tag_materials): the get_object_tags() entries if
+    with_info is set (else an empty list), and the materials assigned by
+    texture tags, in tag order.
+    """
     tags = []
+    materials = []
+    ttexture = c4d.Ttexture
     for tag in obj.GetTags():
-        tag_info = {
-            "name": tag.GetName(),
-            "type": tag.GetTypeName(),
-        }
+        mat = tag.GetMaterial() if tag.GetType() == ttexture else None
+        if mat:
+            materials.append(mat)
+
+        if with_info:
+            tag_info = {
+                "name": tag.GetName(),
+                "type": tag.GetTypeName(),
+            }
 
-        # Extract specific tag info
-        tag_type = tag.GetType()
-        if tag_type == c4d.Ttexture:
-            mat = tag.GetMaterial()
+            # Extract specific tag info
             if mat:
                 tag_info["material"] = mat.GetName()
 
-        tags.append(tag_info)
+            tags.append(tag_info)
 
-    return tags
+    return tags, materials
 
 
 def inspect_object(name, doc=None):
@@ -469,11 +763,12 @@ def inspect_object(name, doc=None):
     rot = obj.GetAbsRot()
     scale = obj.GetAbsScale()
 
-    import math
+    groups, ud_desc_ids = _scan_userdata(obj)
+    tag_infos, tag_materials = _scan_tags(obj, with_info=True)
 
     result = {
         "name": obj.GetName(),
-        "type": detect_dreamtalk_class(obj),
+        "type": detect_dreamtalk_class(obj, groups),
         "c4d_type": obj.GetTypeName(),
         "transform": {
             "position": {"x": round(pos.x, 2), "y": round(pos.y, 2), "z": round(pos.z, 2)},
@@ -481,7 +776,7 @@ def inspect_object(name, doc=None):
             "scale": {"x": round(scale.x, 3), "y": round(scale.y, 3), "z": round(scale.z, 3)},
         },
         "userdata": get_all_userdata(obj),
-        "tags": get_object_tags(obj),
+        "tags": tag_infos,
     }
 
     # Parent info
@@ -499,7 +794,7 @@ def inspect_object(name, doc=None):
         result["children"] = children
 
     # Color
-    color = get_color_from_object(obj)
+    color = get_color_from_object(obj, ud_desc_ids, tag_materials)
     if color:
         result["color"] = {
             "rgb": {"r": round(color[0], 3), "g": round(color[1], 3), "b": round(color[2], 3)},
@@ -518,6 +813,24 @@ def inspect_object(name, doc=None):
     return result
 
 
+def _material_usage(doc):
+    """
+    Map material names to the objects whose texture tags use them.
+
+    One pass over the scene serves every material. Object names are
+    listed in hierarchy order, once per texture tag.
+    """
+    usage = {}
+    ttexture = c4d.Ttexture
+    for obj, _ in _walk(doc.GetFirstObject()):
+        for tag in obj.GetTags():
+            if tag.GetType() == ttexture:
+                tag_mat = tag.GetMaterial()
+                if tag_mat:
+                    usage.setdefault(tag_mat.GetName(), []).append(obj.GetName())
+    return usage
+
+
 def inspect_materials(doc=None):
     """
     Describe all materials in the scene.
@@ -532,6 +845,11 @@ def inspect_materials(doc=None):
         doc = c4d.documents.GetActiveDocument()
 
     materials = []
+    usage = _material_usage(doc)
+    use_color = c4d.MATERIAL_USE_COLOR
+    color_id = c4d.MATERIAL_COLOR_COLOR
+    use_transparency = c4d.MATERIAL_USE_TRANSPARENCY
+    use_luminance = c4d.MATERIAL_USE_LUMINANCE
     mat = doc.GetFirstMaterial()
 
     while mat:
@@ -542,8 +860,8 @@ def inspect_materials(doc=None):
 
         # Try to get color
         try:
-            if mat[c4d.MATERIAL_USE_COLOR]:
-                color = mat[c4d.MATERIAL_COLOR_COLOR]
+            if mat[use_color]:
+                color = mat[color_id]
                 mat_info["color"] = {
                     "rgb": {"r": round(color.x, 3), "g": round(color.y, 3), "b": round(color.z, 3)},
                     "name": color_to_name((color.x, color.y, color.z))
@@ -553,34 +871,22 @@ def inspect_materials(doc=None):
 
         # Try to get transparency
         try:
-            if mat[c4d.MATERIAL_USE_TRANSPARENCY]:
+            if mat[use_transparency]:
                 mat_info["has_transparency"] = True
         except:
             pass
 
         # Try to get luminance/glow
         try:
-            if mat[c4d.MATERIAL_USE_LUMINANCE]:
+            if mat[use_luminance]:
                 mat_info["has_luminance"] = True
         except:
             pass
 
         # Find objects using this material
-        used_by = []
-
-        def find_usage(obj):
-            while obj:
-                for tag in obj.GetTags():
-                    if tag.GetType() == c4d.Ttexture:
-                        tag_mat = tag.GetMaterial()
-                        if tag_mat and tag_mat.GetName() == mat.GetName():
-                            used_by.append(obj.GetName())
-                find_usage(obj.GetDown())
-                obj = obj.GetNext()
-
-        find_usage(doc.GetFirstObject())
+        used_by = usage.get(mat_info["name"])
         if used_by:
-            mat_info["used_by"] = used_by
+            mat_info["used_by"] = list(used_by)
 
         materials.append(mat_info)
         mat = mat.GetNext()
@@ -592,7 +898,42 @@ def inspect_materials(doc=None):
     }
 
 
-def inspect_animation(start_frame=None, end_frame=None, doc=None):
+def _keys_in_range(curve, fps, start_frame, end_frame):
+    """
+    List {frame, value} for the keys of curve between two frames, inclusive.
+
+    CCurve keeps its keys sorted by time, so the first key in range is
+    found by bisection and the scan stops at the first key past the end;
+    keys outside the range cost at most a few C4D calls in total.
+    """
+    count = curve.GetKeyCount()
+    lo, hi = 0, count
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if curve.GetKey(mid).GetTime().GetFrame(fps) < start_frame:
+            lo = mid + 1
+        else:
+            hi = mid
+
+    keyframes = []
+    for i in range(lo, count):
+        key = curve.GetKey(i)
+        frame = key.GetTime().GetFrame(fps)
+        if frame > end_frame:
+            break
+        keyframes.append({
+            "frame": frame,
+            "value": round(key.GetValue(), 3)
+        })
+    return keyframes
+
+
+def _desc_id_key(desc_id):
+    """Hashable key of a DescID, equal exactly when the DescIDs compare equal."""
+    return tuple(desc_id[i].id for i in range(desc_id.GetDepth()))
+
+
+def inspect_animation(start_frame=None, end_frame=None, doc=None, class_cache=None):
     """
     Describe what happens in the animation between frames.
 
@@ -600,6 +941,7 @@ def inspect_animation(start_frame=None, end_frame=None, doc=None):
         start_frame: Start frame (defaults to document start)
         end_frame: End frame (defaults to document end)
         doc: Cinema 4D document (defaults to active document)
+        class_cache: dict memoizing object classes by GUID, see describe_hierarchy()
 
     Returns:
         dict with animation description
@@ -619,56 +961,47 @@ def inspect_animation(start_frame=None, end_frame=None, doc=None):
     # Collect all animated objects and their keyframes
     animated_objects = []
 
-    def find_animated(obj):
-        while obj:
-            tracks = obj.GetCTracks()
-            if tracks:
-                obj_info = {
-                    "name": obj.GetName(),
-                    "type": detect_dreamtalk_class(obj),
-                    "tracks": []
-                }
+    for obj, _ in _walk(doc.GetFirstObject()):
+        tracks = obj.GetCTracks()
+        if tracks:
+            obj_info = {
+                "name": obj.GetName(),
+                "type": _classify(obj, class_cache=class_cache),
+                "tracks": []
+            }
 
-                for track in tracks:
-                    desc_id = track.GetDescriptionID()
-                    curve = track.GetCurve()
-                    if curve:
-                        keyframes = []
-                        for i in range(curve.GetKeyCount()):
-                            key = curve.GetKey(i)
-                            frame = key.GetTime().GetFrame(fps)
-                            if start_frame <= frame <= end_frame:
-                                keyframes.append({
-                                    "frame": frame,
-                                    "value": round(key.GetValue(), 3)
-                                })
-
-                        if keyframes:
-                            # Try to get parameter name
-                            param_name = "Unknown"
-                            try:
-                                # Check common DreamTalk parameters
-                                ud = obj.GetUserDataContainer()
-                                if ud:
-                                    for ud_id, bc in ud:
-                                        if ud_id == desc_id:
-                                            param_name = bc.GetString(c4d.DESC_NAME)
-                                            break
-                            except:
-                                pass
-
-                            obj_info["tracks"].append({
-                                "parameter": param_name,
-                                "keyframes": keyframes
-                            })
-
-                if obj_info["tracks"]:
-                    animated_objects.append(obj_info)
-
-            find_animated(obj.GetDown())
-            obj = obj.GetNext()
-
-    find_animated(doc.GetFirstObject())
+            # Userdata names by DescID, indexed once the first track needs them
+            ud_names = None
+
+            for track in tracks:
+                desc_id = track.GetDescriptionID()
+                curve = track.GetCurve()
+                if curve:
+                    keyframes = _keys_in_range(curve, fps, start_frame, end_frame)
+
+                    if keyframes:
+                        # Try to get parameter name
+                        param_name = "Unknown"
+                        try:
+                            # Check common DreamTalk parameters
+                            if ud_names is None:
+                                ud_names = {}
+                                desc_name = c4d.DESC_NAME
+                                for ud_id, bc in obj.GetUserDataContainer() or ():
+                                    key = _desc_id_key(ud_id)
+                                    if key not in ud_names:
+                                        ud_names[key] = bc.GetString(desc_name)
+                            param_name = ud_names.get(_desc_id_key(desc_id), param_name)
+                        except (AttributeError, TypeError):
+                            pass
+
+                        obj_info["tracks"].append({
+                            "parameter": param_name,
+                            "keyframes": keyframes
+                        })
+
+            if obj_info["tracks"]:
+                animated_objects.append(obj_info)
 
     # Generate summary
     total_keyframes = sum(
@@ -690,12 +1023,13 @@ def inspect_animation(start_frame=None, end_frame=None, doc=None):
     }
 
 
-def validate_scene(doc=None):
+def validate_scene(doc=None, class_cache=None):
     """
     Run sanity checks on the scene before rendering.
 
     Args:
         doc: Cinema 4D document (defaults to active document)
+        class_cache: dict memoizing object classes by GUID, see describe_hierarchy()
 
     Returns:
         dict with validation results and any issues found
@@ -710,60 +1044,57 @@ def validate_scene(doc=None):
     # Check for objects at origin that shouldn't be
     origin_objects = []
 
-    def check_objects(obj, depth=0):
-        while obj:
-            pos = obj.GetAbsPos()
-            name = obj.GetName()
-            obj_type = detect_dreamtalk_class(obj)
-
-            # Check for objects stuck at origin (except root CustomObjects)
-            if depth > 0 and obj_type != "Camera":
-                if pos.x == 0 and pos.y == 0 and pos.z == 0:
-                    # Only flag if it has siblings at different positions
-                    sibling = obj.GetNext() or obj.GetPred()
-                    if sibling:
-                        sib_pos = sibling.GetAbsPos()
-                        if sib_pos.x != 0 or sib_pos.y != 0 or sib_pos.z != 0:
-                            origin_objects.append(name)
-
-            # Check for missing materials on visible objects
-            if obj_type in ("LineObject", "SolidObject"):
-                has_material = False
-                for tag in obj.GetTags():
-                    if tag.GetType() == c4d.Ttexture:
-                        has_material = True
+    ttexture = c4d.Ttexture
+    for obj, depth in _walk(doc.GetFirstObject()):
+        pos = obj.GetAbsPos()
+        name = obj.GetName()
+        groups, ud_desc_ids = _scan_userdata(obj)
+        obj_type = _classify(obj, groups, class_cache)
+
+        # Check for objects stuck at origin (except root CustomObjects)
+        if depth > 0 and obj_type != "Camera":
+            if pos.x == 0 and pos.y == 0 and pos.z == 0:
+                # Only flag if it has siblings at different positions
+                sibling = obj.GetNext() or obj.GetPred()
+                if sibling:
+                    sib_pos = sibling.GetAbsPos()
+                    if sib_pos.x != 0 or sib_pos.y != 0 or sib_pos.z != 0:
+                        origin_objects.append(name)
+
+        # Check for missing materials on visible objects
+        if obj_type in ("LineObject", "SolidObject"):
+            has_material = False
+            for tag in obj.GetTags():
+                if tag.GetType() == ttexture:
+                    has_material = True
+                    break
+            if not has_material:
+                warnings.append(f"'{name}' ({obj_type}) has no material assigned")
+
+        # Check for Python Generator errors (red icon = no cache)
+        if obj.GetType() == _OPYTHON:
+            cache = obj.GetCache()
+            if cache is None:
+                # Don't flag if generator is inside a MoGraph Cloner (known limitation)
+                # Cache returns None for template objects inside Cloners
+                is_inside_cloner = False
+                parent = obj.GetUp()
+                while parent:
+                    if parent.GetType() == _OCLONER:
+                        is_inside_cloner = True
                         break
-                if not has_material:
-                    warnings.append(f"'{name}' ({obj_type}) has no material assigned")
-
-            # Check for Python Generator errors (red icon = no cache)
-            if obj.GetType() == 1023866:  # Python Generator
-                cache = obj.GetCache()
-                if cache is None:
-                    # Don't flag if generator is inside a MoGraph Cloner (known limitation)
-                    # Cache returns None for template objects inside Cloners
-                    is_inside_cloner = False
-                    parent = obj.GetUp()
-                    while parent:
-                        if parent.GetType() == 1018544:  # MoGraph Cloner
-                            is_inside_cloner = True
-                            break
-                        parent = parent.GetUp()
-
-                    if not is_inside_cloner:
-                        issues.append(f"'{name}' (Python Generator) has error - no cache produced")
-
-            # Check for 0 creation on DreamTalk objects
-            creation = get_userdata_value(obj, "Actions", "Creation")
-            if creation is not None and creation == 0:
-                info.append(f"'{name}' has creation at 0% (not animated yet)")
-
-            check_objects(obj.GetDown(), depth + 1)
-            obj = obj.GetNext()
-
-    check_objects(doc.GetFirstObject())
+                    parent = parent.GetUp()
+
+                if not is_inside_cloner:
+                    issues.append(f"'{name}' (Python Generator) has error - no cache produced")
+
+        # Check for 0 creation on DreamTalk objects
+        creation = _read_userdata(obj, ud_desc_ids, "Creation")
+        if creation is not None and creation == 0:
+            info.append(f"'{name}' has creation at 0% (not animated yet)")
 
     # Check materials
+    usage = _material_usage(doc)
     mat = doc.GetFirstMaterial()
     material_count = 0
     unused_materials = []
@@ -773,22 +1104,7 @@ def validate_scene(doc=None):
         mat_name = mat.GetName()
 
         # Check if material is used
-        is_used = False
-
-        def check_usage(obj):
-            nonlocal is_used
-            while obj and not is_used:
-                for tag in obj.GetTags():
-                    if tag.GetType() == c4d.Ttexture:
-                        tag_mat = tag.GetMaterial()
-                        if tag_mat and tag_mat.GetName() == mat_name:
-                            is_used = True
-                            return
-                check_usage(obj.GetDown())
-                obj = obj.GetNext()
-
-        check_usage(doc.GetFirstObject())
-        if not is_used:
+        if mat_name not in usage:
             unused_materials.append(mat_name)
 
         mat = mat.GetNext()
@@ -805,18 +1121,7 @@ def validate_scene(doc=None):
         info.append(f"Render settings: {int(width)}x{int(height)} @ {int(fps)}fps")
 
     # Check for camera
-    has_camera = False
-
-    def find_camera(obj):
-        nonlocal has_camera
-        while obj:
-            if obj.GetType() == _get_c4d_type('Ocamera'):
-                has_camera = True
-                return
-            find_camera(obj.GetDown())
-            obj = obj.GetNext()
-
-    find_camera(doc.GetFirstObject())
+    has_camera = any(obj.GetType() == _OCAMERA for obj, _ in _walk(doc.GetFirstObject()))
     if not has_camera:
         warnings.append("No camera in scene")
 
@@ -953,10 +1258,14 @@ def _capture_native_params(obj):
 
     try:
         desc = obj.GetDescription(c4d.DESCFLAGS_DESC_NONE)
+        desc_customgui = c4d.DESC_CUSTOMGUI
+        desc_name = c4d.DESC_NAME
+        desc_cycle = c4d.DESC_CYCLE
+        vector = c4d.Vector
 
         for bc, paramid, groupid in desc:
             # Skip container/group types that aren't actual values
-            dtype = bc.GetInt32(c4d.DESC_CUSTOMGUI)
+            dtype = bc.GetInt32(desc_customgui)
             if dtype in [0]:  # Skip pure groups
                 continue
 
@@ -972,7 +1281,7 @@ def _capture_native_params(obj):
                     # Skip very long strings (likely code blocks)
                     if len(value) < 200:
                         values[param_key] = value
-                elif isinstance(value, c4d.Vector):
+                elif isinstance(value, vector):
                     values[param_key] = (round(value.x, 4), round(value.y, 4), round(value.z, 4))
                 elif value is None:
                     values[param_key] = None
@@ -983,7 +1292,7 @@ def _capture_native_params(obj):
                 param_meta = {}
 
                 # Parameter name from UI
-                name = bc.GetString(c4d.DESC_NAME)
+                name = bc.GetString(desc_name)
                 if name:
                     param_meta["name"] = name
 
@@ -993,7 +1302,7 @@ def _capture_native_params(obj):
                     param_meta["ident"] = ident
 
                 # Cycle/enum values (dropdown options)
-                cycle = bc.GetContainer(c4d.DESC_CYCLE)
+                cycle = bc.GetContainer(desc_cycle)
                 if cycle:
                     options = {}
                     for i, label in cycle:
@@ -1037,105 +1346,97 @@ def get_scene_snapshot(doc=None):
         "guid_to_name": {}  # For display purposes
     }
 
-    def capture_object(obj):
-        while obj:
-            obj_guid = str(obj.GetGUID())
-            obj_name = obj.GetName()
-
-            # Store GUID -> name mapping for display
-            snapshot["guid_to_name"][obj_guid] = obj_name
-
-            # DreamTalk data (always shown)
-            dreamtalk_data = {}
-
-            # Capture transform
-            pos = obj.GetAbsPos()
-            rot = obj.GetAbsRot()
-            scale = obj.GetAbsScale()
-
-            dreamtalk_data["transform.x"] = round(pos.x, 2)
-            dreamtalk_data["transform.y"] = round(pos.y, 2)
-            dreamtalk_data["transform.z"] = round(pos.z, 2)
-
-            # Only include rotation if non-zero
-            import math
-            if abs(rot.x) > 0.001 or abs(rot.y) > 0.001 or abs(rot.z) > 0.001:
-                dreamtalk_data["transform.h"] = round(math.degrees(rot.x), 2)
-                dreamtalk_data["transform.p"] = round(math.degrees(rot.y), 2)
-                dreamtalk_data["transform.b"] = round(math.degrees(rot.z), 2)
-
-            # Only include scale if non-uniform
-            if abs(scale.x - 1) > 0.001 or abs(scale.y - 1) > 0.001 or abs(scale.z - 1) > 0.001:
-                dreamtalk_data["transform.scale_x"] = round(scale.x, 3)
-                dreamtalk_data["transform.scale_y"] = round(scale.y, 3)
-                dreamtalk_data["transform.scale_z"] = round(scale.z, 3)
-
-            # Capture userdata
-            userdata = get_all_userdata(obj)
-            for group_name, params in userdata.items():
-                for param_name, value in params.items():
-                    key = f"userdata.{group_name}.{param_name}"
-                    # Convert complex types to comparable values
-                    if isinstance(value, dict):
-                        if 'x' in value and 'y' in value and 'z' in value:
-                            value = (value['x'], value['y'], value['z'])
-                    if isinstance(value, float):
-                        value = round(value, 4)
-                    dreamtalk_data[key] = value
-
-            # Capture Sketch Style Tag properties (Tsketchstyle = 1011012)
-            for tag in obj.GetTags():
-                if tag.GetType() == 1011012:  # Tsketchstyle
-                    tag_name = tag.GetName()
-                    prefix = f"tag.{tag_name}"
-
-                    # Material links
-                    try:
-                        visible_mat = tag[10071]  # Default Visible
-                        dreamtalk_data[f"{prefix}.visible_material"] = visible_mat.GetName() if visible_mat else None
-                    except: pass
-                    try:
-                        hidden_mat = tag[10072]  # Default Hidden
-                        dreamtalk_data[f"{prefix}.hidden_material"] = hidden_mat.GetName() if hidden_mat else None
-                    except: pass
-
-                    # Line types enabled
-                    try: dreamtalk_data[f"{prefix}.outline"] = bool(tag[10001])
-                    except: pass
-                    try: dreamtalk_data[f"{prefix}.folds"] = bool(tag[10002])
+    for obj, _ in _walk(doc.GetFirstObject()):
+        obj_guid = str(obj.GetGUID())
+        obj_name = obj.GetName()
+
+        # Store GUID -> name mapping for display
+        snapshot["guid_to_name"][obj_guid] = obj_name
+
+        # DreamTalk data (always shown)
+        dreamtalk_data = {}
+
+        # Capture transform
+        pos = obj.GetAbsPos()
+        rot = obj.GetAbsRot()
+        scale = obj.GetAbsScale()
+
+        dreamtalk_data["transform.x"] = round(pos.x, 2)
+        dreamtalk_data["transform.y"] = round(pos.y, 2)
+        dreamtalk_data["transform.z"] = round(pos.z, 2)
+
+        # Only include rotation if non-zero
+        if abs(rot.x) > 0.001 or abs(rot.y) > 0.001 or abs(rot.z) > 0.001:
+            dreamtalk_data["transform.h"] = round(math.degrees(rot.x), 2)
+            dreamtalk_data["transform.p"] = round(math.degrees(rot.y), 2)
+            dreamtalk_data["transform.b"] = round(math.degrees(rot.z), 2)
+
+        # Only include scale if non-uniform
+        if abs(scale.x - 1) > 0.001 or abs(scale.y - 1) > 0.001 or abs(scale.z - 1) > 0.001:
+            dreamtalk_data["transform.scale_x"] = round(scale.x, 3)
+            dreamtalk_data["transform.scale_y"] = round(scale.y, 3)
+            dreamtalk_data["transform.scale_z"] = round(scale.z, 3)
+
+        # Capture userdata
+        userdata = get_all_userdata(obj)
+        for group_name, params in userdata.items():
+            for param_name, value in params.items():
+                key = f"userdata.{group_name}.{param_name}"
+                # Convert complex types to comparable values
+                if isinstance(value, dict):
+                    if 'x' in value and 'y' in value and 'z' in value:
+                        value = (value['x'], value['y'], value['z'])
+                if isinstance(value, float):
+                    value = round(value, 4)
+                dreamtalk_data[key] = value
+
+        # Capture Sketch Style Tag properties
+        for tag in obj.GetTags():
+            if tag.GetType() == _TSKETCHSTYLE:
+                tag_name = tag.GetName()
+                prefix = f"tag.{tag_name}"
+
+                # Material links
+                try:
+                    visible_mat = tag[10071]  # Default Visible
+                    dreamtalk_data[f"{prefix}.visible_material"] = visible_mat.GetName() if visible_mat else None
+                except: pass
+                try:
+                    hidden_mat = tag[10072]  # Default Hidden
+                    dreamtalk_data[f"{prefix}.hidden_material"] = hidden_mat.GetName() if hidden_mat else None
+                except: pass
+
+                # Line types enabled
+                try: dreamtalk_data[f"{prefix}.outline"] = bool(tag[10001])
+                except: pass
+                try: dreamtalk_data[f"{prefix}.folds"] = bool(tag[10002])
+                except: pass
+                try: dreamtalk_data[f"{prefix}.creases"] = bool(tag[10005])
+                except: pass
+                try: dreamtalk_data[f"{prefix}.contour"] = bool(tag[10010])
+                except: pass
+                try: dreamtalk_data[f"{prefix}.splines"] = bool(tag[10013])
+                except: pass
+
+                # Contour settings (only if contour enabled)
+                if tag[10010]:  # Contour enabled
+                    try: dreamtalk_data[f"{prefix}.contour_mode"] = tag[11000]  # 0=Angle, 1=Position, 2=UVW
                     except: pass
-                    try: dreamtalk_data[f"{prefix}.creases"] = bool(tag[10005])
+                    try: dreamtalk_data[f"{prefix}.contour_position"] = tag[11002]  # 0=Object X, 1=Y, 2=Z
                     except: pass
-                    try: dreamtalk_data[f"{prefix}.contour"] = bool(tag[10010])
+                    try: dreamtalk_data[f"{prefix}.contour_spacing_type"] = tag[11014]  # 0=Relative, 1=Absolute
                     except: pass
-                    try: dreamtalk_data[f"{prefix}.splines"] = bool(tag[10013])
+                    try: dreamtalk_data[f"{prefix}.contour_step"] = round(tag[11016], 2)  # Step value
                     except: pass
 
-                    # Contour settings (only if contour enabled)
-                    if tag[10010]:  # Contour enabled
-                        try: dreamtalk_data[f"{prefix}.contour_mode"] = tag[11000]  # 0=Angle, 1=Position, 2=UVW
-                        except: pass
-                        try: dreamtalk_data[f"{prefix}.contour_position"] = tag[11002]  # 0=Object X, 1=Y, 2=Z
-                        except: pass
-                        try: dreamtalk_data[f"{prefix}.contour_spacing_type"] = tag[11014]  # 0=Relative, 1=Absolute
-                        except: pass
-                        try: dreamtalk_data[f"{prefix}.contour_step"] = round(tag[11016], 2)  # Step value
-                        except: pass
-
-            # Native C4D params (silent - only surfaced on delta)
-            native_params = _capture_native_params(obj)
-
-            snapshot["objects"][obj_guid] = {
-                "name": obj_name,
-                "dreamtalk": dreamtalk_data,
-                "native": native_params
-            }
-
-            # Recurse
-            capture_object(obj.GetDown())
-            obj = obj.GetNext()
+        # Native C4D params (silent - only surfaced on delta)
+        native_params = _capture_native_params(obj)
 
-    capture_object(doc.GetFirstObject())
+        snapshot["objects"][obj_guid] = {
+            "name": obj_name,
+            "dreamtalk": dreamtalk_data,
+            "native": native_params
+        }
 
     # Capture materials (especially Sketch & Toon)
     mat = doc.GetFirstMaterial()
@@ -1145,7 +1446,7 @@ def get_scene_snapshot(doc=None):
         mat_data = {"type": mat.GetTypeName()}
 
         # Sketch & Toon material (Msketch = 1011014)
-        if mat_type == _get_c4d_type('Msketch'):
+        if mat_type == _MSKETCH:
             try:
                 mat_data["thickness"] = round(mat[c4d.OUTLINEMAT_THICKNESS], 2)
             except: pass
@@ -1179,6 +1480,8 @@ def get_scene_snapshot(doc=None):
 
 # Module-level storage for scene snapshots
 _last_snapshot = None
+# Bumped whenever a snapshot comparison can't vouch for an unchanged scene
+_scene_version = 0
 
 # Console log tracking with deduplication
 # Stores: {"messages": [{"text": str, "count": int, "first_seen": int}], "total_captured": int}
@@ -1306,7 +1609,7 @@ def diff_scene(doc=None):
     Returns:
         dict with changes grouped by category (objects, materials)
     """
-    global _last_snapshot
+    global _last_snapshot, _scene_version
 
     if doc is None:
         doc = c4d.documents.GetActiveDocument()
@@ -1315,6 +1618,7 @@ def diff_scene(doc=None):
 
     if _last_snapshot is None:
         _last_snapshot = current
+        _scene_version += 1
         return {
             "status": "first_snapshot",
             "message": "Initial snapshot captured. Make changes and call diff_scene() again.",
@@ -1324,6 +1628,8 @@ def diff_scene(doc=None):
 
     # Use the shared diff function
     diff_result = _compute_diff(_last_snapshot, current)
+    if diff_result["total_changes"] > 0:
+        _scene_version += 1
 
     # Update snapshot for next diff
     _last_snapshot = current
@@ -1369,11 +1675,23 @@ def diff_scene(doc=None):
 
 def reset_snapshot():
     """Reset the scene snapshot to force a fresh capture on next diff."""
-    global _last_snapshot
+    global _last_snapshot, _scene_version
     _last_snapshot = None
+    _scene_version += 1
     return {"status": "reset", "message": "Snapshot cleared"}
 
 
+def get_scene_version():
+    """
+    Return a token identifying the scene state seen by the last snapshot diff.
+
+    The token changes whenever describe_scene() or diff_scene() detect a
+    change (or have no previous snapshot to compare against), so formatted
+    output can be cached per version, see format_for_ai(scene_version=...).
+    """
+    return _scene_version
+
+
 def describe_scene(doc=None):
     """
     Universal scene introspection with automatic change detection.
@@ -1397,7 +1715,7 @@ def describe_scene(doc=None):
     Returns:
         dict with complete scene state, changes detected, and console delta
     """
-    global _last_snapshot
+    global _last_snapshot, _scene_version
 
     if doc is None:
         doc = c4d.documents.GetActiveDocument()
@@ -1411,6 +1729,9 @@ def describe_scene(doc=None):
         diff_result = _compute_diff(_last_snapshot, current_snapshot)
         if diff_result["total_changes"] > 0:
             changes = diff_result
+            _scene_version += 1
+    else:
+        _scene_version += 1
 
     # Update snapshot for next call
     _last_snapshot = current_snapshot
@@ -1421,17 +1742,21 @@ def describe_scene(doc=None):
     doc_start = doc.GetMinTime().GetFrame(fps)
     doc_end = doc.GetMaxTime().GetFrame(fps)
 
+    # The scene doesn't change while it is inspected, so each object is
+    # classified once for all sub-inspections
+    class_cache = {}
+
     # Hierarchy
-    hierarchy = describe_hierarchy(doc)
+    hierarchy = describe_hierarchy(doc, class_cache)
 
     # Materials
     materials = inspect_materials(doc)
 
     # Animation summary
-    animation = inspect_animation(doc_start, doc_end, doc)
+    animation = inspect_animation(doc_start, doc_end, doc, class_cache)
 
     # Validation
-    validation = validate_scene(doc)
+    validation = validate_scene(doc, class_cache)
 
     # Get console delta (new messages since last describe_scene call)
     console_delta = get_console_delta()
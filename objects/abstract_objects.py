@@ -19,6 +19,7 @@ Base classes:
 """
 
 from abc import ABC, abstractmethod
+from functools import cached_property
 import c4d
 import c4d.utils
 
@@ -161,13 +162,14 @@ class ProtoObject(ABC):
         self.obj[descriptor] += scale
         return animation
 
-    @property
+    @cached_property
     def animate(self):
         """
         Fluent animation API.
 
         Returns an AnimatorProxy that provides attribute access for
-        animating any parameter by name.
+        animating any parameter by name. The proxy is created once per
+        object; every call on it starts its own animation chain.
 
         Usage:
             # Animate a UserData parameter
@@ -183,7 +185,7 @@ class ProtoObject(ABC):
             self.play(virus.animate.fold(0.5).x(100), run_time=1.5)
         """
         from DreamTalk.animation.animate import AnimatorProxy
-        return AnimatorProxy(self)
+        return AnimatorProxy(self, root=True)
 
 
 # =============================================================================
@@ -1120,6 +1122,9 @@ class CustomObject(VisibleObject):
         # Set up state machine if States class is defined
         self._state_machine = collect_states(self)
 
+        # Index parameter DescIDs for the fluent animate API
+        self._build_param_descid_table()
+
     def specify_object(self):
         """Create a Python Generator as the container."""
         self.obj = c4d.BaseObject(1023866)  # Python Generator
@@ -1283,11 +1288,34 @@ def main():
             # e.g., self.fold_parameter = param
             setattr(self, f"{name}_parameter", param)
 
+    def _build_param_descid_table(self):
+        """
+        Map parameter names to DescIDs for fast lookup by holon.animate.
+
+        Collects <name>_parameter attributes carrying a desc_id (e.g.
+        self.fold_parameter) and <name>_id attributes (e.g. self.draw_id).
+        Parameter objects take precedence over raw ids of the same name.
+        Only attributes set by now are collected, so the animate resolvers
+        fall back to attribute lookup on a miss.
+        """
+        table = {}
+        for attr, value in vars(self).items():
+            if attr.endswith('_id') and isinstance(value, c4d.DescID):
+                table[attr[:-len('_id')]] = value
+        for attr, value in vars(self).items():
+            if attr.endswith('_parameter'):
+                desc_id = getattr(value, 'desc_id', None)
+                if desc_id is not None:
+                    table[attr[:-len('_parameter')]] = desc_id
+        self._param_descid_table = table
+
     def insert_parameters(self):
         """Insert parameters as UserData."""
         if self.parameters:
             self.parameters_u_group = UGroup(
                 *self.parameters, target=self.obj, name=self.name + "Parameters")
+            # Invalidate the name index used by the fluent animate API
+            self._ud_name_to_descid = None
 
     def insert_parts(self):
         """Insert parts as children of the generator."""
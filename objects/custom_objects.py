@@ -1531,35 +1531,16 @@ class FoldableCube(CustomObject, GeneratorMixin):
         This wraps the null object in a Python Generator that reads the Fold
         UserData parameter and sets child rotations accordingly.
         """
-        from DreamTalk.generator import GENERATOR_IMPORTS
-
         # Create the generator object
         self.gen = c4d.BaseObject(1023866)  # Python Generator
         self.gen.SetName(self.name)
-        self.gen[c4d.OPYTHON_CODE] = GENERATOR_IMPORTS + self.specify_generator_code()
+        self.gen[c4d.OPYTHON_CODE] = self._build_generator_code()
         self.gen[c4d.OPYTHON_OPTIMIZE] = False  # Critical for MoGraph compatibility!
 
-        # Copy UserData from self.obj to generator
-        ud = self.obj.GetUserDataContainer()
-        for desc_id, bc in ud:
-            if bc[c4d.DESC_CUSTOMGUI] == c4d.CUSTOMGUI_SEPARATOR:
-                continue
-            new_id = self.gen.AddUserData(bc)
-            try:
-                self.gen[new_id] = self.obj[desc_id]
-            except:
-                pass
-
-        # Move children from self.obj to generator
-        children = []
-        child = self.obj.GetDown()
-        while child:
-            children.append(child)
-            child = child.GetNext()
-
-        for child in children:
-            child.Remove()
-            child.InsertUnder(self.gen)
+        # Copy UserData and move children using the shared GeneratorMixin helpers.
+        # Values that fail to copy are skipped, conversion must not abort
+        self._copy_userdata_to_generator(self.gen, strict=False)
+        self._move_children_to_generator(self.gen, recursive=False)
 
         # Replace self.obj in the document
         self.gen.InsertAfter(self.obj)
@@ -0,0 +1,90 @@
+"""
+test_generator_code.py - Test generator code rendered from relations
+
+GeneratorMixin translates XIdentity/XRelation patterns into Python
+Generator code. The rendering is plain Python, so this checks the emitted
+source directly:
+
+- the code compiles together with GENERATOR_IMPORTS
+- each target DescID constant (_DID_n) rebuilds the relation's DescID
+- _HANDLERS dispatches on the child names
+- formulas refer to the generator variables, renaming display names by
+  exact name only (Fold -> fold, but Folder stays untouched)
+
+Run inside Cinema 4D (Script Manager) or with c4dpy.
+"""
+
+import c4d
+
+from DreamTalk.generator import GeneratorMixin, _with_generator_imports
+
+
+class _Parameter:
+    def __init__(self, name):
+        self.name = name
+
+
+class _Part:
+    def __init__(self, name):
+        self.obj = c4d.BaseObject(c4d.Onull)
+        self.obj.SetName(name)
+
+
+# The collectors dispatch on the relation's class name
+class XIdentity:
+    def __init__(self, part, desc_ids, parameters):
+        self.part = part
+        self.desc_ids = desc_ids
+        self.parameters = parameters
+
+
+class XRelation(XIdentity):
+    def __init__(self, part, desc_ids, parameters, formula):
+        super().__init__(part, desc_ids, parameters)
+        self.formula = formula
+
+
+RADIUS_ID = c4d.DescID(c4d.DescLevel(c4d.PRIM_CIRCLE_RADIUS, c4d.DTYPE_REAL, 0))
+ROTATION_H = (c4d.ID_BASEOBJECT_ROTATION, c4d.VECTOR_X)
+
+
+class _Host(GeneratorMixin):
+    def __init__(self):
+        fold = _Parameter("Fold")
+        self.relations = [
+            XIdentity(_Part("Circle"), [RADIUS_ID], [fold]),
+            XRelation(_Part("Flap"), [ROTATION_H], [fold], "Fold * PI / 2 + Folder"),
+        ]
+
+
+def _render():
+    code = _Host()._auto_generate_code_from_relations()
+    namespace = {}
+    exec(compile(_with_generator_imports(code), '<test generator>', 'exec'), namespace)
+    return code, namespace
+
+
+def test_target_desc_ids():
+    _, namespace = _render()
+    rotation_h = c4d.DescID(c4d.DescLevel(ROTATION_H[0], c4d.DTYPE_VECTOR, 0),
+                            c4d.DescLevel(ROTATION_H[1], c4d.DTYPE_REAL, 0))
+    assert namespace['_DID_0'] == RADIUS_ID
+    assert namespace['_DID_1'] == rotation_h
+
+
+def test_handlers_by_child_name():
+    _, namespace = _render()
+    assert set(namespace['_HANDLERS']) == {"Circle", "Flap"}
+
+
+def test_formula_renamed():
+    code, _ = _render()
+    assert "child[_DID_0] = fold\n" in code
+    assert "child[_DID_1] = fold * PI / 2 + Folder\n" in code
+    assert 'get_userdata_by_name(op, "Fold")' in code
+
+
+if __name__ == "__main__":
+    for test in (test_target_desc_ids, test_handlers_by_child_name, test_formula_renamed):
+        test()
+        print(f"{test.__name__}: ok")